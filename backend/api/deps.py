@@ -1,6 +1,8 @@
 # backend/api/deps.py
 from __future__ import annotations
 
+import hashlib
+
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
@@ -8,39 +10,56 @@ from sqlalchemy import text
 import jwt  # PyJWT exceptions
 
 from db.session import get_db
+from core.cache import TTLCache
+from core.config import settings
 from core.security import decode_token
 
+_Q_USER_BY_ID = text("select id, username from public.users where id=:uid")
+_Q_IS_MEMBER = text("select 1 from public.league_members where league_id=:lid and user_id=:uid")
+
 # This is what makes Swagger render the 🔒 Authorize button
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
+
+# Authenticated users, keyed by sha256(token) so raw bearer tokens are never
+# kept in memory. Entries live for at most 30 seconds and never past the
+# token's own "exp". Failures are never cached.
+_token_cache = TTLCache(ttl=30, maxsize=10_000)
+
+# Positive league memberships only. Members are never removed from a league,
+# so a cached "yes" cannot go stale; a "no" is always re-checked.
+_member_cache = TTLCache(ttl=settings.league_member_cache_ttl, maxsize=50_000)
 
 
-def _get_token_from_request(request: Request) -> str | None:
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def remember_league_member(league_id, user_id) -> None:
     """
-    Support either:
-      - Cookie: access_token=<jwt>
-      - Header: Authorization: Bearer <jwt>
+    Record a membership the caller just committed, so the next check skips the query.
     """
-    token = request.cookies.get("access_token")
-    if token:
-        return token
+    _member_cache.put((str(league_id), str(user_id)), True)
 
-    auth = request.headers.get("Authorization", "")
-    if auth.lower().startswith("bearer "):
-        return auth.split(" ", 1)[1].strip()
 
-    return None
+def require_league_member(db: Session, league_id: str, user_id) -> None:
+    key = (str(league_id), str(user_id))
+    if _member_cache.get(key):
+        return
+    row = db.execute(_Q_IS_MEMBER, {"lid": league_id, "uid": user_id}).first()
+    if not row:
+        raise HTTPException(status_code=403, detail="Not a member of this league")
+    remember_league_member(league_id, user_id)
 
 
 def get_current_user(
-    # Swagger prefers this; sends Authorization header when you click Authorize
-    token: str = Depends(oauth2_scheme),
-    # Also allows cookie token to work (useful for browser sessions)
-    request: Request = None,  # FastAPI will inject it
+    request: Request,
+    # Swagger sends Authorization: Bearer <jwt> when you click Authorize.
+    # auto_error=False so browser sessions can fall back to the cookie below.
+    token: str | None = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
 ):
-    # If oauth2_scheme didn’t find a header token, fall back to cookie/header manually
     if not token:
-        token = _get_token_from_request(request) if request else None
+        token = request.cookies.get("access_token")
 
     if not token:
         raise HTTPException(
@@ -48,6 +67,11 @@ def get_current_user(
             detail="Not authenticated",
         )
 
+    cache_key = _token_cache_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         payload = decode_token(token)
     except jwt.PyJWTError:
@@ -64,7 +88,7 @@ def get_current_user(
         )
 
     user = db.execute(
-        text("select id, username from public.users where id=:uid"),
+        _Q_USER_BY_ID,
         {"uid": user_id},
     ).mappings().first()
 
@@ -74,4 +98,7 @@ def get_current_user(
             detail="User not found",
         )
 
-    return dict(user)
+    user = dict(user)
+    exp = payload.get("exp")
+    _token_cache.put(cache_key, user, float(exp) if exp is not None else None)
+    return user
@@ -4,8 +4,10 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from api.deps import get_current_user
+from api.routes.events import reload_events
+from api.routes.results import POINTS, clear_results_caches
 from core.config import settings
-from db.session import get_db
+from db.session import engine, get_db
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -20,7 +22,61 @@ class ImportGlobalResultsIn(BaseModel):
     rows: list[GlobalResultRowIn] = Field(min_length=1, max_length=500)
 
 
-POINTS = {1: 8, 2: 5, 3: 3, 4: 1, 5: 1, 6: 1, 7: 1, 8: 1, 9: 1, 10: 1}
+class AdminActionIn(BaseModel):
+    admin_password: str | None = None
+
+
+# Every ref paired with each event it could name (by id, event_key or name).
+_Q_EVENTS_FOR_REFS = text(
+    """
+    select
+      r.ref,
+      e.id::text as id,
+      e.id::text = r.ref as by_id,
+      e.event_key = r.ref as by_key
+    from unnest(cast(:refs as text[])) as r(ref)
+    join public.events e
+      on e.id::text = r.ref
+      or e.event_key = r.ref
+      or lower(e.name) = lower(r.ref)
+    """
+)
+
+_Q_ENTRIES_FOR_NAMES = text(
+    """
+    select w.event_id::text as event_id, w.name, ee.entry_key, ee.entry_name
+    from unnest(cast(:eids as uuid[]), cast(:names as text[])) as w(event_id, name)
+    join public.event_entries ee
+      on ee.event_id = w.event_id
+     and lower(ee.entry_name) = lower(w.name)
+    """
+)
+
+# Taken in id order before replacing results, so two imports touching the same
+# events run one after the other instead of colliding on the unique constraints.
+# NO KEY UPDATE, not UPDATE: it still serialises imports but leaves FK inserts
+# (event_entries, league_events, draft_picks) free to take their KEY SHARE locks.
+_Q_LOCK_EVENTS = text(
+    """
+    select id from public.events
+    where id = any(cast(:eids as uuid[]))
+    order by id
+    for no key update
+    """
+)
+
+_Q_DELETE_GLOBAL_RESULTS = text(
+    "delete from public.global_event_results where event_id = any(cast(:eids as uuid[]))"
+)
+
+_Q_INSERT_GLOBAL_RESULT = text(
+    """
+    insert into public.global_event_results
+      (event_id, place, entry_key, entry_name)
+    values
+      (:eid, :place, :ek, :en)
+    """
+)
 
 
 def _require_results_admin(user: dict, body_password: str | None) -> None:
@@ -35,86 +91,56 @@ def _require_results_admin(user: dict, body_password: str | None) -> None:
         raise HTTPException(status_code=403, detail="Invalid admin password")
 
 
-def _ensure_global_results_table(db: Session) -> None:
-    db.execute(
-        text(
-            """
-            create table if not exists public.global_event_results (
-              id uuid primary key default gen_random_uuid(),
-              event_id uuid not null references public.events(id),
-              place int not null,
-              entry_key text not null,
-              entry_name text not null,
-              created_at timestamptz not null default now(),
-              unique (event_id, place),
-              unique (event_id, entry_key)
-            )
-            """
-        )
-    )
-
-
-def _resolve_event_id(db: Session, event_ref: str) -> str:
-    v = event_ref.strip()
-    if not v:
-        raise HTTPException(status_code=400, detail="Blank event_ref")
-
-    by_id = db.execute(
-        text("select id::text as id from public.events where id::text = :v"),
-        {"v": v},
-    ).mappings().first()
-    if by_id:
-        return str(by_id["id"])
-
-    by_key = db.execute(
-        text("select id::text as id from public.events where event_key = :v"),
-        {"v": v},
-    ).mappings().first()
-    if by_key:
-        return str(by_key["id"])
-
-    by_name = db.execute(
-        text(
-            """
-            select id::text as id
-            from public.events
-            where lower(name) = lower(:v)
-            """
-        ),
-        {"v": v},
-    ).mappings().all()
-    if len(by_name) == 1:
-        return str(by_name[0]["id"])
-    if len(by_name) > 1:
-        raise HTTPException(status_code=400, detail=f"Event name is ambiguous: {v}")
+def _resolve_event_ids(db: Session, event_refs: list[str]) -> dict[str, str]:
+    """
+    Resolve every event_ref in one query.
+    Each ref matches by id, then event_key, then case-insensitive name.
+    """
+    rows = db.execute(_Q_EVENTS_FOR_REFS, {"refs": sorted(set(event_refs))}).mappings().all()
+
+    matches: dict[str, list] = {}
+    for r in rows:
+        matches.setdefault(r["ref"], []).append(r)
 
-    raise HTTPException(status_code=400, detail=f"Event not found for event_ref: {v}")
+    resolved: dict[str, str] = {}
+    for v in event_refs:
+        if not v:
+            raise HTTPException(status_code=400, detail="Blank event_ref")
 
+        candidates = matches.get(v, [])
+        by_id = [c for c in candidates if c["by_id"]]
+        by_key = [c for c in candidates if c["by_key"]]
+        if by_id:
+            resolved[v] = str(by_id[0]["id"])
+        elif by_key:
+            resolved[v] = str(by_key[0]["id"])
+        elif len(candidates) == 1:
+            resolved[v] = str(candidates[0]["id"])
+        elif len(candidates) > 1:
+            raise HTTPException(status_code=400, detail=f"Event name is ambiguous: {v}")
+        else:
+            raise HTTPException(status_code=400, detail=f"Event not found for event_ref: {v}")
 
-def _resolve_entry_for_name(db: Session, event_id: str, athlete_name: str) -> tuple[str, str]:
-    v = athlete_name.strip()
-    if not v:
-        raise HTTPException(status_code=400, detail="Leaderboard contains blank athlete name")
+    return resolved
 
+
+def _resolve_entries_for_names(
+    db: Session, wanted: list[tuple[str, str]]
+) -> dict[tuple[str, str], list]:
+    """
+    Look up (event_id, athlete_name) pairs in one query.
+    Names match entry_name case-insensitively; returns every match per pair.
+    """
+    pairs = sorted(set(wanted))
     rows = db.execute(
-        text(
-            """
-            select entry_key, entry_name
-            from public.event_entries
-            where event_id = :eid
-              and lower(entry_name) = lower(:name)
-            """
-        ),
-        {"eid": event_id, "name": v},
+        _Q_ENTRIES_FOR_NAMES,
+        {"eids": [eid for eid, _ in pairs], "names": [name for _, name in pairs]},
     ).mappings().all()
-    if len(rows) == 1:
-        return str(rows[0]["entry_key"]), str(rows[0]["entry_name"])
-    if len(rows) > 1:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Ambiguous athlete name '{v}' for event {event_id}. Use unique names.",
-        )
-    raise HTTPException(status_code=400, detail=f"Athlete name '{v}' not found for event {event_id}")
+
+    found: dict[tuple[str, str], list] = {}
+    for r in rows:
+        found.setdefault((r["event_id"], r["name"]), []).append(r)
+    return found
 
 
 @router.post("/results/import-global")
@@ -124,38 +150,71 @@ def import_global_results(
     user=Depends(get_current_user),
 ):
     _require_results_admin(user, body.admin_password)
-    _ensure_global_results_table(db)
 
     imported_events = 0
     try:
+        event_ids = _resolve_event_ids(db, [row.event_ref.strip() for row in body.rows])
+
+        leaderboards: list[tuple[str, str, list[str]]] = []
         for row in body.rows:
-            event_id = _resolve_event_id(db, row.event_ref)
-
-            normalized_names = [n.strip() for n in row.leaderboard]
-            if len(set(normalized_names)) != len(normalized_names):
-                raise HTTPException(status_code=400, detail=f"Duplicate athlete names in event_ref '{row.event_ref}'")
-
-            db.execute(
-                text("delete from public.global_event_results where event_id = :eid"),
-                {"eid": event_id},
-            )
-
-            for idx, athlete_name in enumerate(normalized_names, start=1):
-                entry_key, entry_name = _resolve_entry_for_name(db, event_id, athlete_name)
-                db.execute(
-                    text(
-                        """
-                        insert into public.global_event_results
-                          (event_id, place, entry_key, entry_name)
-                        values
-                          (:eid, :place, :ek, :en)
-                        """
-                    ),
-                    {"eid": event_id, "place": idx, "ek": entry_key, "en": entry_name},
+            event_id = event_ids[row.event_ref.strip()]
+
+            normalized_names: list[str] = []
+            seen: set[str] = set()
+            for n in row.leaderboard:
+                name = n.strip()
+                if name in seen:
+                    raise HTTPException(status_code=400, detail=f"Duplicate athlete names in event_ref '{row.event_ref}'")
+                seen.add(name)
+                normalized_names.append(name)
+
+            leaderboards.append((row.event_ref, event_id, normalized_names))
+
+        entries = _resolve_entries_for_names(
+            db,
+            [(event_id, name) for _, event_id, names in leaderboards for name in names if name],
+        )
+
+        # Later rows for the same event replace earlier ones, as before.
+        placements: dict[str, list[dict]] = {}
+        for _, event_id, names in leaderboards:
+            event_rows = []
+            for idx, athlete_name in enumerate(names, start=1):
+                if not athlete_name:
+                    raise HTTPException(status_code=400, detail="Leaderboard contains blank athlete name")
+
+                matches = entries.get((event_id, athlete_name), [])
+                if len(matches) > 1:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Ambiguous athlete name '{athlete_name}' for event {event_id}. Use unique names.",
+                    )
+                if not matches:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Athlete name '{athlete_name}' not found for event {event_id}",
+                    )
+
+                event_rows.append(
+                    {
+                        "eid": event_id,
+                        "place": idx,
+                        "ek": str(matches[0]["entry_key"]),
+                        "en": str(matches[0]["entry_name"]),
+                    }
                 )
+            placements[event_id] = event_rows
             imported_events += 1
 
+        db.execute(_Q_LOCK_EVENTS, {"eids": list(placements)})
+        db.execute(_Q_DELETE_GLOBAL_RESULTS, {"eids": list(placements)})
+        db.execute(
+            _Q_INSERT_GLOBAL_RESULT,
+            [p for event_rows in placements.values() for p in event_rows],
+        )
+
         db.commit()
+        clear_results_caches()
     except HTTPException:
         db.rollback()
         raise
@@ -164,3 +223,36 @@ def import_global_results(
         raise HTTPException(status_code=500, detail="Failed to import global results")
 
     return {"ok": True, "imported_events": imported_events, "points": POINTS}
+
+
+@router.post("/events/reload")
+def reload_events_cache(
+    body: AdminActionIn | None = None,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """
+    Refresh this process's pinned events list after re-seeding events.
+    """
+    _require_results_admin(user, body.admin_password if body else None)
+    events, _ = reload_events(db)
+    return {"ok": True, "events": len(events)}
+
+
+@router.post("/pool")
+def pool_status(
+    body: AdminActionIn | None = None,
+    user=Depends(get_current_user),
+):
+    """
+    Connection pool usage for this process, to spot saturation under load.
+    """
+    _require_results_admin(user, body.admin_password if body else None)
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.db_max_overflow,
+    }
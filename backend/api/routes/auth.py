@@ -3,7 +3,9 @@ from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 
+from db.errors import is_unique_violation
 from db.session import get_db
 from core.security import (
     get_password_hash,
@@ -26,19 +28,29 @@ class LoginIn(BaseModel):
     password: str
 
 
+# ---------- Queries ----------
+
+_Q_USER_BY_USERNAME = text(
+    """
+    select id, username, password_hash, created_at
+    from public.users
+    where username = :u
+    """
+)
+
+_Q_INSERT_USER = text(
+    """
+    insert into public.users (username, password_hash)
+    values (:u, :ph)
+    returning id, username, created_at
+    """
+)
+
+
 # ---------- Helpers ----------
 
 def _get_user_by_username(db: Session, username: str):
-    return db.execute(
-        text(
-            """
-            select id, username, password_hash, created_at
-            from public.users
-            where username = :u
-            """
-        ),
-        {"u": username},
-    ).mappings().first()
+    return db.execute(_Q_USER_BY_USERNAME, {"u": username}).mappings().first()
 
 
 def _user_public(user_row):
@@ -64,24 +76,20 @@ def register(
 
     try:
         user = db.execute(
-            text(
-                """
-                insert into public.users (username, password_hash)
-                values (:u, :ph)
-                returning id, username, created_at
-                """
-            ),
+            _Q_INSERT_USER,
             {"u": body.username, "ph": password_hash},
         ).mappings().first()
 
         db.commit()
-    except Exception as e:
+    except IntegrityError as e:
         db.rollback()
         # If the DB unique constraint on users.username trips, return 409 (not 500).
-        msg = str(e).lower()
-        if "unique" in msg and "username" in msg:
+        if is_unique_violation(e):
             raise HTTPException(status_code=409, detail="Username already taken")
         raise HTTPException(status_code=500, detail="Failed to create user")
+    except Exception:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Failed to create user")
 
     token = create_access_token({"sub": str(user["id"])})
 
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 
+from db.errors import constraint_name, is_unique_violation
 from db.session import get_db
-from api.deps import get_current_user
+from api.deps import get_current_user, require_league_member
 
 router = APIRouter(prefix="/draft", tags=["draft"])
 
@@ -15,39 +18,108 @@ class MakePickIn(BaseModel):
     entry_name: str = Field(min_length=1, max_length=200)
 
 
-def _require_member(db: Session, league_id: str, user_id: str) -> None:
-    row = db.execute(
-        text("select 1 from public.league_members where league_id=:lid and user_id=:uid"),
-        {"lid": league_id, "uid": user_id},
-    ).first()
-    if not row:
+# Statements are built once at import so SQLAlchemy reuses their compiled form.
+_Q_LEAGUE_STATUS_FOR_MEMBER = text(
+    """
+    select
+      l.status,
+      exists(
+        select 1 from public.league_members m
+        where m.league_id = l.id and m.user_id = :uid
+      ) as is_member
+    from public.leagues l
+    where l.id = :lid
+    """
+)
+
+_Q_MEMBERS_IN_DRAFT_ORDER = text(
+    """
+    select u.id, u.username, m.draft_position
+    from public.league_members m
+    join public.users u on u.id = m.user_id
+    where m.league_id = :lid
+    order by m.draft_position asc nulls last, u.id asc
+    """
+)
+
+_Q_DRAFT_EVENT_COUNT = text(
+    """
+    select count(*) as c
+    from public.league_events
+    where league_id = :lid and mode = 'draft'
+    """
+)
+
+# Draft events in order with how many picks each already has.
+# Ignore draft events that currently cannot support one unique pick per member:
+# the offset probe reads at most :member_count index entries per event instead
+# of counting all of event_entries.
+_Q_DRAFT_EVENTS_IN_ORDER = text(
+    """
+    with pick_counts as (
+      select event_id, count(*) as c
+      from public.draft_picks
+      where league_id = :lid
+      group by event_id
+    )
+    select
+      e.id, e.sport, e.name, e.event_key, e.is_team_event, le.sort_order,
+      coalesce(pc.c, 0) as pick_count
+    from public.league_events le
+    join public.events e on e.id = le.event_id
+    left join pick_counts pc on pc.event_id = e.id
+    where le.league_id = :lid
+      and le.mode = 'draft'
+      and exists(
+        select 1 from public.event_entries ee
+        where ee.event_id = e.id
+        offset :member_count - 1
+      )
+    order by le.sort_order asc
+    """
+)
+
+# IMPORTANT: do NOT select p.id (some schemas won't have it)
+_Q_EVENT_PICKS = text(
+    """
+    select user_id, entry_key, entry_name, picked_at
+    from public.draft_picks
+    where league_id = :lid and event_id = :eid
+    order by picked_at asc
+    """
+)
+
+_Q_EVENT_ENTRY = text(
+    """
+    select entry_key, entry_name
+    from public.event_entries
+    where event_id = :eid
+      and entry_key = :ek
+    limit 1
+    """
+)
+
+# IMPORTANT: don't RETURN id (some schemas won't have it)
+_Q_INSERT_PICK = text(
+    """
+    insert into public.draft_picks (league_id, event_id, user_id, entry_key, entry_name)
+    values (:lid, :eid, :uid, :ek, :en)
+    returning league_id, event_id, user_id, entry_key, entry_name, picked_at
+    """
+)
+
+
+def _require_drafting_member(db: Session, league_id: str, user_id: str) -> None:
+    # Membership and league status in one round-trip; membership is checked first.
+    row = db.execute(_Q_LEAGUE_STATUS_FOR_MEMBER, {"lid": league_id, "uid": user_id}).mappings().first()
+    if not row or not row["is_member"]:
         raise HTTPException(status_code=403, detail="Not a member of this league")
-
-
-def _require_drafting(db: Session, league_id: str) -> None:
-    row = db.execute(
-        text("select status from public.leagues where id=:lid"),
-        {"lid": league_id},
-    ).mappings().first()
-    if not row:
-        raise HTTPException(status_code=404, detail="League not found")
     if row["status"] != "drafting":
         raise HTTPException(status_code=409, detail=f"Draft not active (status: {row['status']})")
 
 
 def _get_members_in_draft_order(db: Session, league_id: str):
-    members = db.execute(
-        text(
-            """
-            select u.id, u.username, m.draft_position
-            from public.league_members m
-            join public.users u on u.id = m.user_id
-            where m.league_id = :lid
-            order by m.draft_position asc nulls last, u.id asc
-            """
-        ),
-        {"lid": league_id},
-    ).mappings().all()
+    members = [dict(m) for m in db.execute(_Q_MEMBERS_IN_DRAFT_ORDER, {"lid": league_id}).mappings()]
 
     if not members:
         raise HTTPException(status_code=400, detail="League has no members")
@@ -59,93 +131,105 @@ def _get_members_in_draft_order(db: Session, league_id: str):
 
 
 def _get_events_in_order(db: Session, league_id: str, member_count: int):
-    total_draft_events_row = db.execute(
-        text(
-            """
-            select count(*) as c
-            from public.league_events
-            where league_id = :lid and mode = 'draft'
-            """
-        ),
-        {"lid": league_id},
-    ).mappings().first()
+    """
+    Returns (events, pick_counts) for the league's draft events, in draft order.
+    """
+    total_draft_events_row = db.execute(_Q_DRAFT_EVENT_COUNT, {"lid": league_id}).mappings().first()
     total_draft_events = int(total_draft_events_row["c"]) if total_draft_events_row else 0
     if total_draft_events <= 0:
         # Either events not seeded or league_events not generated yet.
         # start_draft generates league_events, so this message is the most helpful.
         raise HTTPException(status_code=409, detail="Draft events not set. Commissioner must start the draft.")
 
-    # Ignore draft events that currently cannot support one unique pick per member.
-    return db.execute(
-        text(
-            """
-            with entry_counts as (
-              select event_id, count(*) as c
-              from public.event_entries
-              group by event_id
-            )
-            select e.id, e.sport, e.name, e.event_key, e.is_team_event, le.sort_order
-            from public.league_events le
-            join public.events e on e.id = le.event_id
-            left join entry_counts ec on ec.event_id = e.id
-            where le.league_id = :lid
-              and le.mode = 'draft'
-              and coalesce(ec.c, 0) >= :member_count
-            order by le.sort_order asc
-            """
-        ),
+    rows = db.execute(
+        _Q_DRAFT_EVENTS_IN_ORDER,
         {"lid": league_id, "member_count": member_count},
-    ).mappings().all()
+    )
 
+    # Plain tuple rows; column order matches _Q_DRAFT_EVENTS_IN_ORDER.
+    events = []
+    pick_counts = []
+    for eid, sport, name, event_key, is_team_event, sort_order, pick_count in rows:
+        events.append(
+            {
+                "id": eid,
+                "sport": sport,
+                "name": name,
+                "event_key": event_key,
+                "is_team_event": is_team_event,
+                "sort_order": sort_order,
+            }
+        )
+        pick_counts.append(int(pick_count))
+    return events, pick_counts
+
+
+def _get_picks_for_event(db: Session, league_id: str, event_id: str, members: list[dict]) -> list[dict]:
+    # Every picker is a member, so usernames come from the already-loaded members.
+    usernames = {m["id"]: m["username"] for m in members}
+    rows = db.execute(_Q_EVENT_PICKS, {"lid": league_id, "eid": event_id})
+    return [
+        {
+            "user_id": user_id,
+            "username": usernames.get(user_id),
+            "entry_key": entry_key,
+            "entry_name": entry_name,
+            "picked_at": picked_at,
+        }
+        for user_id, entry_key, entry_name, picked_at in rows
+    ]
+
+
+def _current_event_index(member_count: int, pick_counts: list[int]) -> int | None:
+    for idx, c in enumerate(pick_counts):
+        if c < member_count:
+            return idx
+    return None
+
+
+def _build_state(members: list[dict], events, idx: int | None, picks: list[dict]):
+    if idx is None:
+        return {
+            "complete": True,
+            "event": None,
+            "event_index": None,
+            "direction": None,
+            "members": members,
+            "picks": [],
+            "on_the_clock": None,
+        }
+
+    # Serpentine: even events run in draft order, odd events in reverse.
+    forward = not (idx & 1)
+    on_the_clock = members[len(picks)] if forward else members[-1 - len(picks)]
 
-def _get_picks_for_event(db: Session, league_id: str, event_id: str):
-    # IMPORTANT: do NOT select p.id (some schemas won't have it)
-    return db.execute(
-        text(
-            """
-            select p.user_id, u.username, p.entry_key, p.entry_name, p.picked_at
-            from public.draft_picks p
-            join public.users u on u.id = p.user_id
-            where p.league_id = :lid and p.event_id = :eid
-            order by p.picked_at asc
-            """
-        ),
-        {"lid": league_id, "eid": event_id},
-    ).mappings().all()
+    return {
+        "complete": False,
+        "event": events[idx],
+        "event_index": idx,
+        "direction": "forward" if forward else "reverse",
+        "members": members,
+        "picks": picks,
+        "on_the_clock": {"id": str(on_the_clock["id"]), "username": on_the_clock["username"]},
+    }
 
 
-def _current_state(db: Session, league_id: str):
+def _load_draft(db: Session, league_id: str):
+    """
+    Loads everything needed to answer "whose turn is it":
+    members, draft events with pick counts, the current event index
+    and the picks already made for that one event.
+    """
     members = _get_members_in_draft_order(db, league_id)
+    events, pick_counts = _get_events_in_order(db, league_id, len(members))
+    idx = _current_event_index(len(members), pick_counts)
+    picks = _get_picks_for_event(db, league_id, str(events[idx]["id"]), members) if idx is not None else []
+    return members, events, pick_counts, idx, picks
 
-    n = len(members)
-    events = _get_events_in_order(db, league_id, n)
-
-    for idx, ev in enumerate(events):
-        picks = _get_picks_for_event(db, league_id, str(ev["id"]))
-        if len(picks) < n:
-            forward = (idx % 2 == 0)
-            order = members if forward else list(reversed(members))
-            on_the_clock = order[len(picks)]
-
-            return {
-                "complete": False,
-                "event": dict(ev),
-                "event_index": idx,
-                "direction": "forward" if forward else "reverse",
-                "members": [dict(m) for m in members],
-                "picks": [dict(p) for p in picks],
-                "on_the_clock": {"id": str(on_the_clock["id"]), "username": on_the_clock["username"]},
-            }
 
-    return {
-        "complete": True,
-        "event": None,
-        "event_index": None,
-        "direction": None,
-        "members": [dict(m) for m in members],
-        "picks": [],
-        "on_the_clock": None,
-    }
+def _current_state(db: Session, league_id: str):
+    members, events, _, idx, picks = _load_draft(db, league_id)
+    return _build_state(members, events, idx, picks)
 
 
 @router.get("/state")
@@ -154,8 +238,8 @@ def draft_state(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    _require_member(db, league_id, user["id"])
-    return _current_state(db, league_id)
+    require_league_member(db, league_id, user["id"])
+    return ORJSONResponse(_current_state(db, league_id))
 
 
 @router.post("/pick")
@@ -174,10 +258,10 @@ def make_pick(
     if not entry_name:
         raise HTTPException(status_code=400, detail="entry_name cannot be blank")
 
-    _require_member(db, league_id, user["id"])
-    _require_drafting(db, league_id)
+    _require_drafting_member(db, league_id, user["id"])
 
-    state = _current_state(db, league_id)
+    members, events, pick_counts, idx, picks = _load_draft(db, league_id)
+    state = _build_state(members, events, idx, picks)
     if state["complete"]:
         raise HTTPException(status_code=409, detail="Draft is complete")
 
@@ -185,17 +269,7 @@ def make_pick(
         raise HTTPException(status_code=409, detail="Not your turn")
 
     event_id = str(state["event"]["id"])
-    entry_row = db.execute(
-        text(
-            """
-            select entry_key, entry_name
-            from public.event_entries
-            where event_id = :eid
-              and entry_key = :ek
-            """
-        ),
-        {"eid": event_id, "ek": entry_key},
-    ).mappings().first()
+    entry_row = db.execute(_Q_EVENT_ENTRY, {"eid": event_id, "ek": entry_key}).mappings().first()
     if not entry_row:
         raise HTTPException(status_code=400, detail="Invalid entry for this event")
 
@@ -203,15 +277,8 @@ def make_pick(
     entry_name = str(entry_row["entry_name"])
 
     try:
-        # IMPORTANT: don't RETURN id (some schemas won't have it)
         row = db.execute(
-            text(
-                """
-                insert into public.draft_picks (league_id, event_id, user_id, entry_key, entry_name)
-                values (:lid, :eid, :uid, :ek, :en)
-                returning league_id, event_id, user_id, entry_key, entry_name, picked_at
-                """
-            ),
+            _Q_INSERT_PICK,
             {
                 "lid": league_id,
                 "eid": event_id,
@@ -223,18 +290,41 @@ def make_pick(
 
         db.commit()
 
-    except Exception as e:
+    except IntegrityError as e:
         db.rollback()
 
-        msg = str(e).lower()
-
-        # Turn common constraint failures into friendly messages
-        if "uq_pick_user_per_event" in msg or ("unique" in msg and "user" in msg and "event" in msg):
-            raise HTTPException(status_code=409, detail="You already picked for this event")
-        if "uq_pick_no_dupe_entry" in msg or ("unique" in msg and "entry" in msg):
-            raise HTTPException(status_code=409, detail="That entry was already drafted for this event")
+        # Turn common constraint failures into friendly messages.
+        # Unnamed schemas get generated names like draft_picks_..._user_id_key.
+        if is_unique_violation(e):
+            name = constraint_name(e)
+            if name == "uq_pick_user_per_event" or "user" in name:
+                raise HTTPException(status_code=409, detail="You already picked for this event")
+            if name == "uq_pick_no_dupe_entry" or "entry" in name:
+                raise HTTPException(status_code=409, detail="That entry was already drafted for this event")
 
         # Generic conflict (don't leak internals)
         raise HTTPException(status_code=409, detail="Pick rejected")
 
-    return {"ok": True, "pick": dict(row), "state": _current_state(db, league_id)}
+    except Exception:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Pick rejected")
+
+    # Advance the state we already loaded instead of re-reading the whole draft.
+    picks.append(
+        {
+            "user_id": row["user_id"],
+            "username": user["username"],
+            "entry_key": row["entry_key"],
+            "entry_name": row["entry_name"],
+            "picked_at": row["picked_at"],
+        }
+    )
+    pick_counts[idx] += 1
+
+    next_idx = _current_event_index(len(members), pick_counts)
+    if next_idx != idx:
+        picks = []
+        if next_idx is not None and pick_counts[next_idx]:
+            picks = _get_picks_for_event(db, league_id, str(events[next_idx]["id"]), members)
+
+    return ORJSONResponse({"ok": True, "pick": dict(row), "state": _build_state(members, events, next_idx, picks)})
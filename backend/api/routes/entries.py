@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
@@ -8,6 +9,42 @@ from api.deps import get_current_user
 router = APIRouter(prefix="/entries", tags=["entries"])
 
 
+# Always one row: the caller's membership and the event's team flag (null if no such event).
+_Q_MEMBER_AND_EVENT = text(
+    """
+    select
+      exists(
+        select 1 from public.league_members
+        where league_id = :lid and user_id = :uid
+      ) as is_member,
+      (select is_team_event from public.events where id = :eid) as is_team_event
+    """
+)
+
+_Q_SEARCH_ENTRIES = text(
+    """
+    select id, event_id, entry_key, entry_name, country_code, is_team
+    from public.event_entries
+    where event_id = :eid
+      and is_team = :required_is_team
+      and (entry_name ilike :q or entry_key ilike :q)
+    order by similarity(entry_name, :raw_q) desc, entry_name asc
+    limit :lim
+    """
+)
+
+_Q_LIST_ENTRIES = text(
+    """
+    select id, event_id, entry_key, entry_name, country_code, is_team
+    from public.event_entries
+    where event_id = :eid
+      and is_team = :required_is_team
+    order by entry_name asc
+    limit :lim
+    """
+)
+
+
 @router.get("/for-event")
 def entries_for_event(
     league_id: str,
@@ -17,19 +54,14 @@ def entries_for_event(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    # require membership (same pattern as other routes)
-    row = db.execute(
-        text("select 1 from public.league_members where league_id=:lid and user_id=:uid"),
-        {"lid": league_id, "uid": user["id"]},
-    ).first()
-    if not row:
-        raise HTTPException(status_code=403, detail="Not a member of this league")
-
+    # require membership (same pattern as other routes), then the event
     event_row = db.execute(
-        text("select is_team_event from public.events where id = :eid"),
-        {"eid": event_id},
-    ).mappings().first()
-    if not event_row:
+        _Q_MEMBER_AND_EVENT,
+        {"lid": league_id, "uid": user["id"], "eid": event_id},
+    ).mappings().one()
+    if not event_row["is_member"]:
+        raise HTTPException(status_code=403, detail="Not a member of this league")
+    if event_row["is_team_event"] is None:
         raise HTTPException(status_code=404, detail="Event not found")
 
     required_is_team = bool(event_row["is_team_event"])
@@ -37,32 +69,19 @@ def entries_for_event(
 
     if q:
         rows = db.execute(
-            text(
-                """
-                select id, event_id, entry_key, entry_name, country_code, is_team
-                from public.event_entries
-                where event_id = :eid
-                  and is_team = :required_is_team
-                  and (entry_name ilike :q or entry_key ilike :q)
-                order by entry_name asc
-                limit :lim
-                """
-            ),
-            {"eid": event_id, "required_is_team": required_is_team, "q": f"%{q.strip()}%", "lim": limit},
+            _Q_SEARCH_ENTRIES,
+            {
+                "eid": event_id,
+                "required_is_team": required_is_team,
+                "q": f"%{q.strip()}%",
+                "raw_q": q.strip(),
+                "lim": limit,
+            },
         ).mappings().all()
     else:
         rows = db.execute(
-            text(
-                """
-                select id, event_id, entry_key, entry_name, country_code, is_team
-                from public.event_entries
-                where event_id = :eid
-                  and is_team = :required_is_team
-                order by entry_name asc
-                limit :lim
-                """
-            ),
+            _Q_LIST_ENTRIES,
             {"eid": event_id, "required_is_team": required_is_team, "lim": limit},
         ).mappings().all()
 
-    return {"event_id": event_id, "entries": [dict(r) for r in rows]}
+    return ORJSONResponse({"event_id": event_id, "entries": [dict(r) for r in rows]})
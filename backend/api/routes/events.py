@@ -1,102 +1,148 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
+from core.cache import TTLCache
 from db.session import get_db
 from api.deps import get_current_user
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
-def _require_member(db: Session, league_id: str, user_id: str) -> None:
-    row = db.execute(
-        text("select 1 from public.league_members where league_id=:lid and user_id=:uid"),
-        {"lid": league_id, "uid": user_id},
-    ).first()
-    if not row:
-        raise HTTPException(status_code=403, detail="Not a member of this league")
+_Q_MEMBERS_IN_DRAFT_ORDER = text(
+    """
+    select u.id, u.username, m.draft_position
+    from public.league_members m
+    join public.users u on u.id = m.user_id
+    where m.league_id = :lid
+    order by m.draft_position asc nulls last, u.id asc
+    """
+)
 
+_Q_EVENT_PICK_COUNTS = text(
+    """
+    select e.id, count(p.event_id) as c
+    from public.events e
+    left join public.draft_picks p
+      on p.event_id = e.id and p.league_id = :lid
+    group by e.id, e.sort_order
+    order by e.sort_order asc
+    """
+)
 
-def _get_members_in_draft_order(db: Session, league_id: str):
-    members = db.execute(
-        text(
-            """
-            select u.id, u.username, m.draft_position
-            from public.league_members m
-            join public.users u on u.id = m.user_id
-            where m.league_id = :lid
-            order by m.draft_position asc nulls last, u.id asc
-            """
+_Q_EVENT_SUMMARY = text(
+    """
+    select
+      exists(
+        select 1 from public.league_members
+        where league_id = :lid and user_id = :uid
+      ) as is_member,
+      (select status from public.leagues where id = :lid) as league_status,
+      (
+        select row_to_json(ev)
+        from (
+          select id, sport, name, event_key, is_team_event, sort_order
+          from public.events
+          where id = :eid
+        ) ev
+      ) as event,
+      coalesce(
+        (
+          select json_agg(
+            json_build_object(
+              'user_id', p.user_id,
+              'username', u.username,
+              'entry_key', p.entry_key,
+              'entry_name', p.entry_name,
+              'picked_at', p.picked_at
+            )
+            order by p.picked_at asc
+          )
+          from public.draft_picks p
+          join public.users u on u.id = p.user_id
+          where p.league_id = :lid and p.event_id = :eid
         ),
-        {"lid": league_id},
-    ).mappings().all()
+        '[]'::json
+      ) as picks,
+      coalesce(
+        (
+          select json_agg(
+            json_build_object(
+              'place', r.place,
+              'entry_key', r.entry_key,
+              'entry_name', r.entry_name,
+              'created_at', r.created_at
+            )
+            order by r.place asc
+          )
+          from public.global_event_results r
+          where r.event_id = :eid
+        ),
+        '[]'::json
+      ) as results
+    """
+)
+
+_Q_EVENTS_IN_ORDER = text(
+    """
+    select id, sport, name, event_key, is_team_event, sort_order
+    from public.events
+    order by sort_order asc
+    """
+)
+
+_Q_EVENT_BY_ID = text(
+    """
+    select id, sport, name, event_key, is_team_event, sort_order
+    from public.events
+    where id = :eid
+    """
+)
+
+
+# Events are seeded by scripts and effectively static while the app runs.
+# Loaded at startup and pinned per process; the TTL is only a backstop for
+# re-seeds that happen without a call to /admin/events/reload.
+_events_cache = TTLCache(ttl=300, maxsize=1)
+
+
+def reload_events(db) -> tuple[list[dict], dict[str, dict]]:
+    """
+    (Re)load every event into the process cache. Accepts a Session or Connection.
+    Returns all events in sort order, plus the same dicts keyed by str(id).
+    """
+    events = [dict(r) for r in db.execute(_Q_EVENTS_IN_ORDER).mappings()]
+    cached = (events, {str(ev["id"]): ev for ev in events})
+    _events_cache.put("events", cached)
+    return cached
+
+
+def _get_events(db: Session) -> tuple[list[dict], dict[str, dict]]:
+    cached = _events_cache.get("events")
+    if cached is None:
+        cached = reload_events(db)
+    return cached
+
+
+def _get_members_in_draft_order(db: Session, league_id: str):
+    members = db.execute(_Q_MEMBERS_IN_DRAFT_ORDER, {"lid": league_id}).mappings().all()
     return members
 
 
-def _get_events_in_order(db: Session):
-    return db.execute(
-        text(
-            """
-            select id, sport, name, event_key, is_team_event, sort_order
-            from public.events
-            order by sort_order asc
-            """
-        )
-    ).mappings().all()
-
-
-def _get_picks_for_event(db: Session, league_id: str, event_id: str):
-    return db.execute(
-        text(
-            """
-            select
-              p.id,
-              p.user_id,
-              u.username,
-              p.entry_key,
-              p.entry_name,
-              p.picked_at
-            from public.draft_picks p
-            join public.users u on u.id = p.user_id
-            where p.league_id = :lid and p.event_id = :eid
-            order by p.picked_at asc
-            """
-        ),
-        {"lid": league_id, "eid": event_id},
-    ).mappings().all()
-
-
-def _get_results_for_event(db: Session, league_id: str, event_id: str):
-    return db.execute(
-        text(
-            """
-            select place, entry_key, entry_name, created_at
-            from public.global_event_results
-            where event_id = :eid
-            order by place asc
-            """
-        ),
-        {"eid": event_id},
-    ).mappings().all()
-
-
-def _ensure_global_results_table(db: Session) -> None:
-    db.execute(
-        text(
-            """
-            create table if not exists public.global_event_results (
-              id uuid primary key default gen_random_uuid(),
-              event_id uuid not null references public.events(id),
-              place int not null,
-              entry_key text not null,
-              entry_name text not null,
-              created_at timestamptz not null default now(),
-              unique (event_id, place),
-              unique (event_id, entry_key)
-            )
-            """
-        )
-    )
+def _get_event_pick_counts(db: Session, league_id: str):
+    """
+    Every event in draft order with how many picks this league has made for it.
+    """
+    return db.execute(_Q_EVENT_PICK_COUNTS, {"lid": league_id}).mappings().all()
+
+
+def _get_event_summary(db: Session, league_id: str, event_id: str, user_id: str):
+    """
+    Membership flag, league status, event row, picks and global results in one round-trip.
+    picks/results come back as JSON arrays already in response order.
+    """
+    return db.execute(_Q_EVENT_SUMMARY, {"lid": league_id, "eid": event_id, "uid": user_id}).mappings().one()
 
 
 def _compute_draft_context(db: Session, league_id: str):
@@ -110,15 +156,13 @@ def _compute_draft_context(db: Session, league_id: str):
     if not members or members[0]["draft_position"] is None:
         return {"draft_started": False, "current_event_id": None, "on_the_clock": None}
 
-    events = _get_events_in_order(db)
     n = len(members)
 
-    for idx, ev in enumerate(events):
-        picks = _get_picks_for_event(db, league_id, str(ev["id"]))
-        if len(picks) < n:
-            forward = (idx % 2 == 0)
-            order = members if forward else list(reversed(members))
-            on_the_clock = order[len(picks)]
+    for idx, ev in enumerate(_get_event_pick_counts(db, league_id)):
+        c = ev["c"]
+        if c < n:
+            forward = not (idx & 1)
+            on_the_clock = members[c] if forward else members[-1 - c]
             return {
                 "draft_started": True,
                 "current_event_id": str(ev["id"]),
@@ -132,53 +176,22 @@ def _compute_draft_context(db: Session, league_id: str):
 
 @router.get("/")
 def list_events(db: Session = Depends(get_db)):
-    rows = db.execute(
-        text(
-            """
-            select id, sport, name, event_key, is_team_event, sort_order
-            from public.events
-            order by sort_order asc
-            """
-        )
-    ).mappings().all()
-
-    return [
-        {
-            "id": str(r["id"]),
-            "sport": r["sport"],
-            "name": r["name"],
-            "event_key": r["event_key"],
-            "is_team_event": r["is_team_event"],
-            "sort_order": r["sort_order"],
-        }
-        for r in rows
-    ]
+    events, _ = _get_events(db)
+    return ORJSONResponse(events)
 
 
 @router.get("/{event_id}")
 def event_detail(event_id: str, db: Session = Depends(get_db)):
-    row = db.execute(
-        text(
-            """
-            select id, sport, name, event_key, is_team_event, sort_order
-            from public.events
-            where id = :eid
-            """
-        ),
-        {"eid": event_id},
-    ).mappings().first()
+    _, by_id = _get_events(db)
+    row = by_id.get(event_id)
+    if row is None:
+        # Not cached (e.g. seeded since the last refresh); ask the database.
+        row = db.execute(_Q_EVENT_BY_ID, {"eid": event_id}).mappings().first()
 
     if not row:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    return {
-        "id": str(row["id"]),
-        "sport": row["sport"],
-        "name": row["name"],
-        "event_key": row["event_key"],
-        "is_team_event": row["is_team_event"],
-        "sort_order": row["sort_order"],
-    }
+    return ORJSONResponse(dict(row))
 
 
 @router.get("/league/{league_id}/{event_id}/summary")
@@ -188,55 +201,27 @@ def event_summary_for_league(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    _require_member(db, league_id, user["id"])
-    _ensure_global_results_table(db)
-
-    event = db.execute(
-        text(
-            """
-            select id, sport, name, event_key, is_team_event, sort_order
-            from public.events
-            where id = :eid
-            """
-        ),
-        {"eid": event_id},
-    ).mappings().first()
-    if not event:
+    summary = _get_event_summary(db, league_id, event_id, user["id"])
+    if not summary["is_member"]:
+        raise HTTPException(status_code=403, detail="Not a member of this league")
+    if not summary["event"]:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    picks = _get_picks_for_event(db, league_id, event_id)
-    results = _get_results_for_event(db, league_id, event_id)
-
-    draft_ctx = _compute_draft_context(db, league_id)
-
-    return {
-        "league_id": league_id,
-        "event": {
-            "id": str(event["id"]),
-            "sport": event["sport"],
-            "name": event["name"],
-            "event_key": event["event_key"],
-            "is_team_event": event["is_team_event"],
-            "sort_order": event["sort_order"],
-        },
-        "picks": [
-            {
-                "user_id": str(p["user_id"]),
-                "username": p["username"],
-                "entry_key": p["entry_key"],
-                "entry_name": p["entry_name"],
-                "picked_at": p["picked_at"],
-            }
-            for p in picks
-        ],
-        "results": [
-            {
-                "place": r["place"],
-                "entry_key": r["entry_key"],
-                "entry_name": r["entry_name"],
-                "created_at": r["created_at"],
-            }
-            for r in results
-        ],
-        "draft": draft_ctx,
-    }
+    # Only a drafting league has a moving "on the clock"; skip the pick scan otherwise.
+    status = summary["league_status"]
+    if status == "drafting":
+        draft_ctx = _compute_draft_context(db, league_id)
+    elif status == "lobby":
+        draft_ctx = {"draft_started": False, "current_event_id": None, "on_the_clock": None}
+    else:
+        draft_ctx = {"draft_started": True, "current_event_id": None, "on_the_clock": None, "complete": True}
+
+    return ORJSONResponse(
+        {
+            "league_id": league_id,
+            "event": summary["event"],
+            "picks": summary["picks"],
+            "results": summary["results"],
+            "draft": draft_ctx,
+        }
+    )
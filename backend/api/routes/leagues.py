@@ -1,27 +1,273 @@
+import base64
+import random
 import secrets
-import string
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
 from db.session import get_db
-from api.deps import get_current_user
+from api.deps import get_current_user, remember_league_member
 
 router = APIRouter(prefix="/leagues", tags=["leagues"])
 
 
+_Q_LEAGUE_FOR_UPDATE = text("select commissioner_id, status from public.leagues where id=:lid for update")
+
+# Creates the league and auto-joins the commissioner in one statement.
+# A code collision returns no row instead of raising.
+_Q_CREATE_LEAGUE = text(
+    """
+    with l as (
+      insert into public.leagues (code, name, status, commissioner_id, draft_rounds)
+      values (:code, :name, 'lobby', :cid, :dr)
+      on conflict (code) do nothing
+      returning id, code, name, status, commissioner_id, draft_rounds, created_at
+    ),
+    m as (
+      insert into public.league_members (league_id, user_id)
+      select id, :cid from l
+      on conflict do nothing
+    )
+    select * from l
+    """
+)
+
+# Looks the league up by code and, only if it is still in the lobby, adds :uid as a member.
+# Returns the league row either way so the caller can tell "not found" from "already started".
+_Q_JOIN_LEAGUE = text(
+    """
+    with league as (
+      select id, code, name, status, commissioner_id
+      from public.leagues
+      where code = :c
+    ),
+    joined as (
+      insert into public.league_members (league_id, user_id)
+      select id, :uid from league where status = 'lobby'
+      on conflict do nothing
+    )
+    select id, code, name, status, commissioner_id from league
+    """
+)
+
+# Everything start_draft validates, in one round-trip. Locks the league row so a
+# concurrent start (or lock) waits and then sees the new status.
+# draftable_ids: events with more entries than the league has members (an offset
+# probe per event rather than counting all of event_entries).
+_Q_START_PREFLIGHT = text(
+    """
+    with members as (
+      select array(
+        select user_id::text
+        from public.league_members
+        where league_id = :lid
+        order by user_id
+      ) as ids
+    )
+    select
+      l.commissioner_id,
+      l.status,
+      l.draft_rounds,
+      (select count(*) from public.events) as events_count,
+      (select ids from members) as member_ids,
+      array(
+        select e.id::text
+        from public.events e
+        where exists(
+          select 1 from public.event_entries ee
+          where ee.event_id = e.id
+          offset (select cardinality(ids) from members)
+        )
+      ) as draftable_ids,
+      exists(
+        select 1 from public.league_events le where le.league_id = l.id
+      ) as events_generated
+    from public.leagues l
+    where l.id = :lid
+    for update of l
+    """
+)
+
+# Entries for every auto (non-draft) event; assignment happens in Python.
+_Q_AUTO_EVENT_ENTRIES = text(
+    """
+    select ee.event_id, ee.entry_key, ee.entry_name
+    from public.event_entries ee
+    left join unnest(cast(:draft_ids as uuid[])) as d(id) on d.id = ee.event_id
+    where d.id is null
+    """
+)
+
+_Q_INSERT_AUTO_PICK = text(
+    """
+    insert into public.draft_picks (league_id, event_id, user_id, entry_key, entry_name)
+    values (:lid, :eid, :uid, :ek, :en)
+    on conflict do nothing
+    """
+)
+
+# Generates league_events, writes draft positions and flips the league to
+# 'drafting' in one statement, returning the new draft order.
+# - draft mode for the events in :draft_ids
+# - all other events are auto mode
+# - :member_ids is already shuffled; position = index in the array (1-based)
+_Q_START_DRAFT = text(
+    """
+    with draft_events as (
+      select id from unnest(cast(:draft_ids as uuid[])) as d(id)
+    ),
+    generated as (
+      insert into public.league_events (league_id, event_id, mode, sort_order)
+      select
+        :lid,
+        e.id,
+        case when d.id is not null then 'draft' else 'auto' end as mode,
+        e.sort_order
+      from public.events e
+      left join draft_events d on d.id = e.id
+    ),
+    positioned as (
+      update public.league_members m
+      set draft_position = s.pos
+      from unnest(cast(:member_ids as uuid[])) with ordinality as s(user_id, pos)
+      where m.league_id = :lid
+        and m.user_id = s.user_id
+      returning m.user_id, m.draft_position
+    ),
+    started as (
+      update public.leagues set status = 'drafting' where id = :lid
+    )
+    select u.id, u.username, p.draft_position
+    from positioned p
+    join public.users u on u.id = p.user_id
+    order by p.draft_position asc, u.id asc
+    """
+)
+
+_Q_SET_LOCKED = text("update public.leagues set status='locked' where id=:lid")
+
+# The whole response body, built in Postgres and passed through as text. body is null
+# unless :uid is itself a member, so the caller's membership is checked in the same query.
+# No index supplies the (draft_position nulls last, user_id) order: members not yet placed tie on
+# draft_position, and neither uq_league_draft_position nor ix_league_members_order breaks that tie
+# on user_id. json_agg sorts the league's few member rows itself after the join with users.
+_Q_DRAFT_ORDER_BODY = text(
+    """
+    select json_build_object(
+      'league_id', cast(:lid as uuid),
+      'draft_order', coalesce(
+        (
+          select json_agg(
+            json_build_object('id', u.id, 'username', u.username, 'draft_position', m.draft_position)
+            order by m.draft_position asc nulls last, m.user_id asc
+          )
+          from public.league_members m
+          join public.users u on u.id = m.user_id
+          where m.league_id = :lid
+        ),
+        '[]'::json
+      )
+    )::text as body
+    where exists(
+      select 1 from public.league_members me
+      where me.league_id = :lid and me.user_id = :uid
+    )
+    """
+)
+
+# A user's leagues as one JSON array, newest first, passed through as text.
+# Keyset on (created_at, id) so leagues sharing a created_at are not skipped; a null :lim means no limit.
+_Q_MY_LEAGUES_BODY = text(
+    """
+    select coalesce(json_agg(t order by t.created_at desc, t.id desc), '[]'::json)::text as body
+    from (
+      select l.id, l.code, l.name, l.status, l.commissioner_id, l.created_at, l.draft_rounds
+      from public.leagues l
+      join public.league_members m on m.league_id = l.id
+      where m.user_id = :uid
+        and (
+          cast(:before as timestamptz) is null
+          or (l.created_at, l.id) < (cast(:before as timestamptz), cast(:before_id as uuid))
+        )
+      order by l.created_at desc, l.id desc
+      limit cast(:lim as int)
+    ) t
+    """
+)
+
+# League, membership flag and member list in one round-trip; members arrive as a JSON array in display order.
+# json_agg sorts the members after the join with users; the member count is small enough that this is cheap.
+_Q_LEAGUE_DETAIL = text(
+    """
+    select
+      exists(
+        select 1 from public.league_members me
+        where me.league_id = l.id and me.user_id = :uid
+      ) as is_member,
+      row_to_json(l) as league,
+      coalesce(
+        (
+          select json_agg(
+            json_build_object(
+              'id', u.id,
+              'username', u.username,
+              'joined_at', m.joined_at,
+              'draft_position', m.draft_position
+            )
+            order by m.draft_position asc nulls last, m.joined_at asc, m.user_id asc
+          )
+          from public.league_members m
+          join public.users u on u.id = m.user_id
+          where m.league_id = l.id
+        ),
+        '[]'::json
+      ) as members
+    from (
+      select id, code, name, status, commissioner_id, draft_rounds, created_at
+      from public.leagues
+      where id = :lid
+    ) l
+    """
+)
+
+
 def _make_league_code() -> str:
-    # Friendly invite codes like: YL-AB12CD
-    alphabet = string.ascii_uppercase + string.digits
-    return "YL-" + "".join(secrets.choice(alphabet) for _ in range(6))
+    # Friendly invite codes like: YL-AB23CD (base32: A-Z and 2-7, no 0/1/8/9)
+    return "YL-" + base64.b32encode(secrets.token_bytes(5)).decode("ascii")[:6]
+
+
+def _auto_picks(league_id: str, member_ids: list, entries) -> list[dict]:
+    """
+    One random entry per member for each auto event (rows are event_id, entry_key, entry_name).
+    Events with fewer entries than members cycle through them and suffix the
+    repeated keys so the (league, event, entry_key) uniqueness still holds.
+    """
+    by_event: dict = {}
+    for event_id, entry_key, entry_name in entries:
+        by_event.setdefault(event_id, []).append((entry_key, entry_name))
+
+    picks = []
+    for event_id, event_entries in by_event.items():
+        random.shuffle(event_entries)
+        entry_count = len(event_entries)
+        for pos, user_id in enumerate(member_ids, start=1):
+            entry_key, entry_name = event_entries[(pos - 1) % entry_count]
+            if pos > entry_count:
+                entry_key = f"{entry_key}__AUTO_DUP__{pos}"
+            picks.append(
+                {"lid": league_id, "eid": event_id, "uid": user_id, "ek": entry_key, "en": entry_name}
+            )
+    return picks
 
 
-def _require_commissioner(db: Session, league_id: str, user_id: str) -> None:
-    row = db.execute(
-        text("select commissioner_id from public.leagues where id=:lid"),
-        {"lid": league_id, "uid": user_id},
-    ).mappings().first()
+def _require_commissioner(db: Session, league_id: str, user_id: str):
+    """
+    Returns the league row (commissioner_id, status), locked until the transaction ends.
+    """
+    row = db.execute(_Q_LEAGUE_FOR_UPDATE, {"lid": league_id}).mappings().first()
 
     if not row:
         raise HTTPException(status_code=404, detail="League not found")
@@ -29,14 +275,7 @@ def _require_commissioner(db: Session, league_id: str, user_id: str) -> None:
     if str(row["commissioner_id"]) != str(user_id):
         raise HTTPException(status_code=403, detail="Commissioner only")
 
-
-def _require_member(db: Session, league_id: str, user_id: str) -> None:
-    row = db.execute(
-        text("select 1 from public.league_members where league_id=:lid and user_id=:uid"),
-        {"lid": league_id, "uid": user_id},
-    ).first()
-    if not row:
-        raise HTTPException(status_code=403, detail="Not a member of this league")
+    return row
 
 
 class CreateLeagueIn(BaseModel):
@@ -56,45 +295,24 @@ def create_league(
 ):
     league_row = None
 
-    for _ in range(5):
-        code = _make_league_code()
-        try:
-            # 1) create league (NO commit yet)
+    try:
+        for _ in range(5):
             league_row = db.execute(
-                text(
-                    """
-                    insert into public.leagues (code, name, status, commissioner_id, draft_rounds)
-                    values (:code, :name, 'lobby', :cid, :dr)
-                    returning id, code, name, status, commissioner_id, draft_rounds, created_at
-                    """
-                ),
-                {"code": code, "name": body.name, "cid": user["id"], "dr": body.draft_rounds},
+                _Q_CREATE_LEAGUE,
+                {"code": _make_league_code(), "name": body.name, "cid": user["id"], "dr": body.draft_rounds},
             ).mappings().first()
-
-            # 2) auto-join commissioner (still NO commit yet)
-            db.execute(
-                text(
-                    """
-                    insert into public.league_members (league_id, user_id)
-                    values (:lid, :uid)
-                    on conflict do nothing
-                    """
-                ),
-                {"lid": league_row["id"], "uid": user["id"]},
-            )
-
-            # 3) commit ONCE (atomic)
-            db.commit()
-            break
-
-        except Exception:
-            db.rollback()
-            league_row = None
+            if league_row:
+                break
+        db.commit()
+    except Exception:
+        db.rollback()
+        league_row = None
 
     if not league_row:
         raise HTTPException(status_code=500, detail="Failed to create league")
 
-    return dict(league_row)
+    remember_league_member(league_row["id"], user["id"])
+    return ORJSONResponse(dict(league_row))
 
 
 @router.post("/join")
@@ -103,10 +321,8 @@ def join_league(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    league = db.execute(
-        text("select id, code, name, status, commissioner_id from public.leagues where code = :c"),
-        {"c": body.code.upper()},
-    ).mappings().first()
+    # Lookup and membership insert in one round-trip; the insert only happens for lobby leagues.
+    league = db.execute(_Q_JOIN_LEAGUE, {"c": body.code.upper(), "uid": user["id"]}).mappings().first()
 
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
@@ -115,19 +331,10 @@ def join_league(
     if league["status"] != "lobby":
         raise HTTPException(status_code=409, detail="League already started; cannot join now")
 
-    db.execute(
-        text(
-            """
-            insert into public.league_members (league_id, user_id)
-            values (:lid, :uid)
-            on conflict do nothing
-            """
-        ),
-        {"lid": league["id"], "uid": user["id"]},
-    )
     db.commit()
+    remember_league_member(league["id"], user["id"])
 
-    return {"ok": True, "league": dict(league)}
+    return ORJSONResponse({"ok": True, "league": dict(league)})
 
 
 @router.post("/{league_id}/start")
@@ -146,50 +353,29 @@ def start_draft(
     - randomizes draft order ONCE by assigning league_members.draft_position = 1..N
     - sets league.status = 'drafting'
     """
-    _require_commissioner(db, league_id, user["id"])
-
-    league = db.execute(
-        text("select status, draft_rounds from public.leagues where id=:lid"),
-        {"lid": league_id},
-    ).mappings().first()
+    league = db.execute(_Q_START_PREFLIGHT, {"lid": league_id}).mappings().first()
 
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
 
+    if str(league["commissioner_id"]) != str(user["id"]):
+        raise HTTPException(status_code=403, detail="Commissioner only")
+
     if league["status"] != "lobby":
         raise HTTPException(status_code=409, detail=f"League not in lobby (status: {league['status']})")
 
     # Ensure events are seeded
-    events_count_row = db.execute(text("select count(*) as c from public.events")).mappings().first()
-    events_count = int(events_count_row["c"]) if events_count_row else 0
+    events_count = int(league["events_count"])
     if events_count <= 0:
         raise HTTPException(status_code=400, detail="No events seeded")
 
-    member_count_row = db.execute(
-        text("select count(*) as c from public.league_members where league_id = :lid"),
-        {"lid": league_id},
-    ).mappings().first()
-    member_count = int(member_count_row["c"]) if member_count_row else 0
+    member_ids = list(league["member_ids"])
+    member_count = len(member_ids)
     if member_count <= 0:
         raise HTTPException(status_code=400, detail="League has no members")
 
-    draftable_events_row = db.execute(
-        text(
-            """
-            with entry_counts as (
-              select event_id, count(*) as c
-              from public.event_entries
-              group by event_id
-            )
-            select count(*) as c
-            from public.events e
-            left join entry_counts ec on ec.event_id = e.id
-            where coalesce(ec.c, 0) > :member_count
-            """
-        ),
-        {"member_count": member_count},
-    ).mappings().first()
-    draftable_events_count = int(draftable_events_row["c"]) if draftable_events_row else 0
+    draftable_ids = list(league["draftable_ids"])
+    draftable_events_count = len(draftable_ids)
 
     draft_rounds = int(league["draft_rounds"])
     if draft_rounds < 1:
@@ -204,270 +390,51 @@ def start_draft(
         )
 
     # Prevent double-generation (events should be generated exactly once)
-    already = db.execute(
-        text("select 1 from public.league_events where league_id=:lid limit 1"),
-        {"lid": league_id},
-    ).first()
-    if already:
+    if league["events_generated"]:
         raise HTTPException(status_code=409, detail="League events already generated")
 
     auto_count = events_count - draft_rounds
     auto_with_entries_count = draftable_events_count - draft_rounds
     auto_waiting_for_entries_count = events_count - draftable_events_count
 
-    # Generate league_events:
-    # - draft mode uses a random subset of events with more entries than league member count
-    # - all other events are auto mode
-    db.execute(
-        text(
-            """
-            with entry_counts as (
-              select event_id, count(*) as c
-              from public.event_entries
-              group by event_id
-            ),
-            draftable_events as (
-              select e.id, coalesce(ec.c, 0) as entry_count
-              from public.events e
-              left join entry_counts ec on ec.event_id = e.id
-              where coalesce(ec.c, 0) > :member_count
-            ),
-            draft_events as (
-              select id
-              from draftable_events
-              order by random()
-              limit :draft_n
-            )
-            insert into public.league_events (league_id, event_id, mode, sort_order)
-            select
-              :lid,
-              e.id,
-              case when d.id is not null then 'draft' else 'auto' end as mode,
-              e.sort_order
-            from public.events e
-            left join draft_events d on d.id = e.id
-            """
-        ),
-        {"lid": league_id, "draft_n": draft_rounds, "member_count": member_count},
-    )
-
-    if auto_count > 0 and member_count > 0:
-        # Auto-assign non-draft events that have enough unique entries (no repeats needed).
-        db.execute(
-            text(
-                """
-                with auto_events as (
-                  select event_id as id
-                  from public.league_events
-                  where league_id = :lid
-                    and mode = 'auto'
-                ),
-                members as (
-                  select
-                    user_id,
-                    row_number() over (order by user_id) as member_pos
-                  from public.league_members
-                  where league_id = :lid
-                ),
-                auto_event_counts as (
-                  select
-                    ae.id as event_id,
-                    coalesce(ec.c, 0) as entry_count
-                  from auto_events ae
-                  left join (
-                    select event_id, count(*) as c
-                    from public.event_entries
-                    group by event_id
-                  ) ec on ec.event_id = ae.id
-                ),
-                enough_events as (
-                  select event_id
-                  from auto_event_counts
-                  where entry_count >= :member_count
-                ),
-                ranked_entries as (
-                  select
-                    ee.event_id,
-                    ee.entry_key,
-                    ee.entry_name,
-                    row_number() over (
-                      partition by ee.event_id
-                      order by random()
-                    ) as entry_pos
-                  from public.event_entries ee
-                  join enough_events eev on eev.event_id = ee.event_id
-                )
-                insert into public.draft_picks (league_id, event_id, user_id, entry_key, entry_name)
-                select
-                  :lid,
-                  eev.event_id,
-                  m.user_id,
-                  re.entry_key,
-                  re.entry_name
-                from enough_events eev
-                cross join members m
-                join ranked_entries re
-                  on re.event_id = eev.event_id
-                 and re.entry_pos = m.member_pos
-                """
-            ),
-            {"lid": league_id, "member_count": member_count},
-        )
-
-        # Auto-assign non-draft events that do NOT have enough unique entries.
-        # In this case, cycle entries and suffix duplicate keys so DB uniqueness is preserved.
-        db.execute(
-            text(
-                """
-                with auto_events as (
-                  select event_id as id
-                  from public.league_events
-                  where league_id = :lid
-                    and mode = 'auto'
-                ),
-                members as (
-                  select
-                    user_id,
-                    row_number() over (order by user_id) as member_pos
-                  from public.league_members
-                  where league_id = :lid
-                ),
-                auto_event_counts as (
-                  select
-                    ae.id as event_id,
-                    coalesce(ec.c, 0) as entry_count
-                  from auto_events ae
-                  left join (
-                    select event_id, count(*) as c
-                    from public.event_entries
-                    group by event_id
-                  ) ec on ec.event_id = ae.id
-                ),
-                short_events as (
-                  select event_id, entry_count
-                  from auto_event_counts
-                  where entry_count > 0
-                    and entry_count < :member_count
-                ),
-                ranked_entries as (
-                  select
-                    ee.event_id,
-                    ee.entry_key,
-                    ee.entry_name,
-                    row_number() over (
-                      partition by ee.event_id
-                      order by random()
-                    ) as entry_pos
-                  from public.event_entries ee
-                  join short_events se on se.event_id = ee.event_id
-                ),
-                member_slots as (
-                  select
-                    se.event_id,
-                    se.entry_count,
-                    m.user_id,
-                    m.member_pos,
-                    ((m.member_pos - 1) % se.entry_count) + 1 as desired_entry_pos
-                  from short_events se
-                  cross join members m
-                )
-                insert into public.draft_picks (league_id, event_id, user_id, entry_key, entry_name)
-                select
-                  :lid,
-                  ms.event_id,
-                  ms.user_id,
-                  case
-                    when ms.member_pos <= ms.entry_count then re.entry_key
-                    else re.entry_key || '__AUTO_DUP__' || ms.member_pos::text
-                  end as entry_key,
-                  re.entry_name
-                from member_slots ms
-                join ranked_entries re
-                  on re.event_id = ms.event_id
-                 and re.entry_pos = ms.desired_entry_pos
-                on conflict do nothing
-                """
-            ),
-            {"lid": league_id, "member_count": member_count},
-        )
-
-    auto_events_needing_backfill = 0
-    if auto_count > 0 and member_count > 0:
-        row = db.execute(
-            text(
-                """
-                select count(*) as c
-                from (
-                  select le.event_id
-                  from public.league_events le
-                  left join public.draft_picks p
-                    on p.league_id = le.league_id
-                   and p.event_id = le.event_id
-                  where le.league_id = :lid
-                    and le.mode = 'auto'
-                  group by le.event_id
-                  having count(p.user_id) < :member_count
-                ) t
-                """
-            ),
-            {"lid": league_id, "member_count": member_count},
-        ).mappings().first()
-        auto_events_needing_backfill = int(row["c"]) if row else 0
-
-    # Assign random draft positions to current members (1..N)
-    db.execute(
-        text(
-            """
-            with shuffled as (
-              select
-                user_id,
-                row_number() over (order by random()) as pos
-              from public.league_members
-              where league_id = :lid
-            )
-            update public.league_members m
-            set draft_position = s.pos
-            from shuffled s
-            where m.league_id = :lid
-              and m.user_id = s.user_id
-            """
-        ),
-        {"lid": league_id},
-    )
-
-    # Start drafting
-    db.execute(
-        text("update public.leagues set status='drafting' where id=:lid"),
-        {"lid": league_id},
-    )
-
-    # Single commit for: league_events + draft positions + status update
-    db.commit()
-
+    # Generate league_events, assign random draft positions (1..N) and start drafting.
+    # Draft events are a random subset of the draftable ones; the order is a Python shuffle.
+    draft_ids = random.sample(draftable_ids, draft_rounds)
     order = db.execute(
-        text(
-            """
-            select u.id, u.username, m.draft_position
-            from public.league_members m
-            join public.users u on u.id = m.user_id
-            where m.league_id = :lid
-            order by m.draft_position asc, u.id asc
-            """
-        ),
-        {"lid": league_id},
+        _Q_START_DRAFT,
+        {"lid": league_id, "draft_ids": draft_ids, "member_ids": random.sample(member_ids, len(member_ids))},
     ).mappings().all()
 
-    return {
-        "ok": True,
-        "league_id": league_id,
-        "status": "drafting",
-        "draft_order": [dict(r) for r in order],
-        "draft_rounds": draft_rounds,
-        "auto_rounds": auto_count,
-        "auto_rounds_with_entries": auto_with_entries_count,
-        "auto_rounds_waiting_for_entries": auto_waiting_for_entries_count,
-        "auto_events_needing_backfill": auto_events_needing_backfill,
-    }
+    if auto_count > 0:
+        # Auto-assign every non-draft event that has entries: shuffled in Python,
+        # inserted with one executemany.
+        entries = db.execute(_Q_AUTO_EVENT_ENTRIES, {"draft_ids": draft_ids})
+        picks = _auto_picks(league_id, member_ids, entries)
+        if picks:
+            db.execute(_Q_INSERT_AUTO_PICK, picks)
+
+        # Every auto event with at least one entry got a pick per member above;
+        # the ones without entries are left for a later backfill.
+        auto_events_needing_backfill = auto_count - len({p["eid"] for p in picks})
+    else:
+        auto_events_needing_backfill = 0
+
+    # Single commit for: league_events + auto picks + draft positions + status update
+    db.commit()
+
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "league_id": league_id,
+            "status": "drafting",
+            "draft_order": [dict(r) for r in order],
+            "draft_rounds": draft_rounds,
+            "auto_rounds": auto_count,
+            "auto_rounds_with_entries": auto_with_entries_count,
+            "auto_rounds_waiting_for_entries": auto_waiting_for_entries_count,
+            "auto_events_needing_backfill": auto_events_needing_backfill,
+        }
+    )
 
 
 @router.post("/{league_id}/lock")
@@ -481,25 +448,15 @@ def lock_league(
     - sets league.status = 'locked'
     After this, results can be submitted (per results.py).
     """
-    _require_commissioner(db, league_id, user["id"])
-
-    league = db.execute(
-        text("select status from public.leagues where id=:lid"),
-        {"lid": league_id},
-    ).mappings().first()
-    if not league:
-        raise HTTPException(status_code=404, detail="League not found")
+    league = _require_commissioner(db, league_id, user["id"])
 
     if league["status"] == "lobby":
         raise HTTPException(status_code=409, detail="Cannot lock before draft starts")
 
-    db.execute(
-        text("update public.leagues set status='locked' where id=:lid"),
-        {"lid": league_id},
-    )
+    db.execute(_Q_SET_LOCKED, {"lid": league_id})
     db.commit()
 
-    return {"ok": True, "league_id": league_id, "status": "locked"}
+    return ORJSONResponse({"ok": True, "league_id": league_id, "status": "locked"})
 
 
 @router.get("/{league_id}/draft-order")
@@ -508,43 +465,35 @@ def draft_order(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    _require_member(db, league_id, user["id"])
-
-    rows = db.execute(
-        text(
-            """
-            select u.id, u.username, m.draft_position
-            from public.league_members m
-            join public.users u on u.id = m.user_id
-            where m.league_id = :lid
-            order by m.draft_position asc nulls last, u.id asc
-            """
-        ),
-        {"lid": league_id},
-    ).mappings().all()
+    body = db.execute(_Q_DRAFT_ORDER_BODY, {"lid": league_id, "uid": user["id"]}).scalar()
+    if body is None:
+        raise HTTPException(status_code=403, detail="Not a member of this league")
 
-    return {"league_id": league_id, "draft_order": [dict(r) for r in rows]}
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/mine")
 def my_leagues(
+    before: datetime | None = None,
+    before_id: str | None = None,
+    limit: int | None = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    rows = db.execute(
-        text(
-            """
-            select l.id, l.code, l.name, l.status, l.commissioner_id, l.created_at, l.draft_rounds
-            from public.leagues l
-            join public.league_members m on m.league_id = l.id
-            where m.user_id = :uid
-            order by l.created_at desc
-            """
-        ),
-        {"uid": user["id"]},
-    ).mappings().all()
+    """
+    Newest first; every league unless `limit` is given.
+    For the next page pass the last league's created_at and id as `before` and `before_id`.
+    """
+    if (before is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before and before_id must be passed together")
+    if limit is not None:
+        limit = max(1, min(limit, 200))
+    body = db.execute(
+        _Q_MY_LEAGUES_BODY,
+        {"uid": user["id"], "before": before, "before_id": before_id, "lim": limit},
+    ).scalar_one()
 
-    return [dict(r) for r in rows]
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{league_id}")
@@ -553,36 +502,8 @@ def league_detail(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    _require_member(db, league_id, user["id"])
-
-    league = db.execute(
-        text(
-            """
-            select id, code, name, status, commissioner_id, draft_rounds, created_at
-            from public.leagues
-            where id = :lid
-            """
-        ),
-        {"lid": league_id},
-    ).mappings().first()
-
-    members = db.execute(
-        text(
-            """
-            select u.id, u.username, m.joined_at, m.draft_position
-            from public.league_members m
-            join public.users u on u.id = m.user_id
-            where m.league_id = :lid
-            order by
-              m.draft_position asc nulls last,
-              m.joined_at asc,
-              u.id asc
-            """
-        ),
-        {"lid": league_id},
-    ).mappings().all()
+    row = db.execute(_Q_LEAGUE_DETAIL, {"lid": league_id, "uid": user["id"]}).mappings().first()
+    if not row or not row["is_member"]:
+        raise HTTPException(status_code=403, detail="Not a member of this league")
 
-    return {
-        "league": dict(league) if league else None,
-        "members": [dict(m) for m in members],
-    }
+    return ORJSONResponse({"league": row["league"], "members": row["members"]})
@@ -1,61 +1,80 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-from api.deps import get_current_user
+from api.deps import get_current_user, require_league_member
 from db.session import get_db
 
 router = APIRouter(tags=["me"])
 
 
+_Q_MY_PICKS = text(
+    """
+    select
+      e.id as event_id,
+      e.sort_order,
+      e.sport,
+      e.name as event_name,
+      p.entry_key,
+      p.entry_name,
+      p.picked_at
+    from public.draft_picks p
+    join public.events e on e.id = p.event_id
+    where p.league_id = :lid and p.user_id = :uid
+    order by e.sort_order asc
+    """
+)
+
+# Same picks, each with the global result its entry earned (place is null if unplaced).
+# Auto picks match on the entry_key without the __AUTO_DUP__ suffix, as on the leaderboard.
+_Q_MY_PICKS_WITH_RESULTS = text(
+    """
+    select
+      e.id as event_id,
+      e.sort_order,
+      e.sport,
+      e.name as event_name,
+      p.entry_key,
+      p.entry_name,
+      p.picked_at,
+      r.place
+    from public.draft_picks p
+    join public.events e on e.id = p.event_id
+    left join public.global_event_results r
+      on r.event_id = p.event_id
+     and r.entry_key = split_part(p.entry_key, '__AUTO_DUP__', 1)
+    where p.league_id = :lid and p.user_id = :uid
+    order by e.sort_order asc
+    """
+)
+
+
 @router.get("/me")
-def me(user=Depends(get_current_user)):
+def me(response: Response, user=Depends(get_current_user)):
+    # Same lifetime as the server-side token cache; lets the browser skip re-polls.
+    response.headers["Cache-Control"] = "private, max-age=30"
     return user
 
 
 @router.get("/me/picks")
 def my_picks(
     league_id: str,
+    include: str = "",
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
     # Must be a member of the league
-    is_member = db.execute(
-        text(
-            """
-            select 1
-            from public.league_members
-            where league_id = :lid and user_id = :uid
-            """
-        ),
-        {"lid": league_id, "uid": user["id"]},
-    ).first()
-
-    if not is_member:
-        raise HTTPException(status_code=403, detail="Not a member of this league")
-
-    rows = db.execute(
-        text(
-            """
-            select
-              e.id as event_id,
-              e.sort_order,
-              e.sport,
-              e.name as event_name,
-              p.entry_key,
-              p.entry_name,
-              p.picked_at
-            from public.draft_picks p
-            join public.events e on e.id = p.event_id
-            where p.league_id = :lid and p.user_id = :uid
-            order by e.sort_order asc
-            """
-        ),
-        {"lid": league_id, "uid": user["id"]},
-    ).mappings().all()
-
-    return {
-        "league_id": league_id,
-        "user_id": user["id"],
-        "picks": [dict(r) for r in rows],
-    }
+    require_league_member(db, league_id, user["id"])
+
+    # include=results adds each pick's placement, saving a /results/event call per event.
+    query = _Q_MY_PICKS_WITH_RESULTS if "results" in include.split(",") else _Q_MY_PICKS
+    rows = db.execute(query, {"lid": league_id, "uid": user["id"]}).mappings().all()
+
+    return ORJSONResponse(
+        {
+            "league_id": league_id,
+            "user_id": user["id"],
+            "picks": [dict(r) for r in rows],
+        }
+    )
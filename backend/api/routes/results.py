@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, conint
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
+from core.cache import TTLCache
 from db.session import get_db
-from api.deps import get_current_user
+from api.deps import get_current_user, remember_league_member, require_league_member
 
 router = APIRouter(prefix="/results", tags=["results"])
 
@@ -13,6 +15,77 @@ router = APIRouter(prefix="/results", tags=["results"])
 POINTS = {1: 8, 2: 5, 3: 3, 4: 1, 5: 1, 6: 1, 7: 1, 8: 1, 9: 1, 10: 1}
 MAX_PLACE = max(POINTS.keys())
 
+# POINTS as parallel arrays for the leaderboard's points join.
+_POINT_PLACES = list(POINTS)
+_POINT_VALUES = list(POINTS.values())
+
+# Scoring comes from POINTS via :places/:points, so the SQL never restates the table.
+_Q_LEADERBOARD = text(
+    """
+    select
+      u.id as user_id,
+      u.username as username,
+      coalesce(sum(pp.points), 0) as points,
+      row_number() over (order by coalesce(sum(pp.points), 0) desc, u.username asc) as rank
+    from public.league_members m
+    join public.users u
+      on u.id = m.user_id
+    left join public.draft_picks p
+      on p.league_id = m.league_id
+     and p.user_id = m.user_id
+    left join public.global_event_results r
+      on r.event_id = p.event_id
+      and r.entry_key = split_part(p.entry_key, '__AUTO_DUP__', 1)
+    left join unnest(cast(:places as int[]), cast(:points as int[])) as pp(place, points)
+      on pp.place = r.place
+    where m.league_id = :lid
+      and exists(
+        select 1 from public.league_members me
+        where me.league_id = :lid and me.user_id = :uid
+      )
+    group by u.id, u.username
+    order by points desc, u.username asc
+    """
+)
+
+# Membership flag and the event's placements (as a JSON array in place order) in one round-trip.
+_Q_EVENT_RESULTS = text(
+    """
+    select
+      exists(
+        select 1 from public.league_members
+        where league_id = :lid and user_id = :uid
+      ) as is_member,
+      coalesce(
+        (
+          select json_agg(
+            json_build_object(
+              'place', place,
+              'entry_key', entry_key,
+              'entry_name', entry_name,
+              'created_at', created_at
+            )
+            order by place asc
+          )
+          from public.global_event_results
+          where event_id = :eid
+        ),
+        '[]'::json
+      ) as placements
+    """
+)
+
+
+# Results only change through the admin import, which clears both caches in this
+# process; the TTLs bound staleness on other workers and for picks made mid-draft.
+_event_results_cache = TTLCache(ttl=60, maxsize=1_000)
+_leaderboard_cache = TTLCache(ttl=15, maxsize=10_000)
+
+
+def clear_results_caches() -> None:
+    _event_results_cache.clear()
+    _leaderboard_cache.clear()
+
 
 class PlacementIn(BaseModel):
     place: conint(ge=1, le=MAX_PLACE)  # type: ignore
@@ -26,62 +99,6 @@ class SubmitResultsIn(BaseModel):
     placements: list[PlacementIn]
 
 
-def _require_member(db: Session, league_id: str, user_id: str) -> None:
-    row = db.execute(
-        text(
-            """
-            select 1
-            from public.league_members
-            where league_id=:lid and user_id=:uid
-            """
-        ),
-        {"lid": league_id, "uid": user_id},
-    ).first()
-    if not row:
-        raise HTTPException(status_code=403, detail="Not a member of this league")
-
-
-def _require_commissioner(db: Session, league_id: str, user_id: str) -> None:
-    row = db.execute(
-        text("select commissioner_id from public.leagues where id=:lid"),
-        {"lid": league_id},
-    ).mappings().first()
-    if not row:
-        raise HTTPException(status_code=404, detail="League not found")
-    if str(row["commissioner_id"]) != str(user_id):
-        raise HTTPException(status_code=403, detail="Commissioner only")
-
-
-def _require_locked(db: Session, league_id: str) -> None:
-    row = db.execute(
-        text("select status from public.leagues where id=:lid"),
-        {"lid": league_id},
-    ).mappings().first()
-    if not row:
-        raise HTTPException(status_code=404, detail="League not found")
-    if row["status"] != "locked":
-        raise HTTPException(status_code=409, detail=f"League not locked (status: {row['status']})")
-
-
-def _ensure_global_results_table(db: Session) -> None:
-    db.execute(
-        text(
-            """
-            create table if not exists public.global_event_results (
-              id uuid primary key default gen_random_uuid(),
-              event_id uuid not null references public.events(id),
-              place int not null,
-              entry_key text not null,
-              entry_name text not null,
-              created_at timestamptz not null default now(),
-              unique (event_id, place),
-              unique (event_id, entry_key)
-            )
-            """
-        )
-    )
-
-
 @router.post("/submit")
 def submit_results(
     body: SubmitResultsIn,
@@ -101,70 +118,54 @@ def get_event_results(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    _require_member(db, league_id, user["id"])
-    _ensure_global_results_table(db)
-
-    rows = db.execute(
-        text(
-            """
-            select place, entry_key, entry_name, created_at
-            from public.global_event_results
-            where event_id=:eid
-            order by place asc
-            """
-        ),
-        {"eid": event_id},
-    ).mappings().all()
+    placements = _event_results_cache.get(event_id)
+    if placements is not None:
+        require_league_member(db, league_id, user["id"])
+    else:
+        row = db.execute(_Q_EVENT_RESULTS, {"lid": league_id, "eid": event_id, "uid": user["id"]}).mappings().one()
+        if not row["is_member"]:
+            raise HTTPException(status_code=403, detail="Not a member of this league")
+        remember_league_member(league_id, user["id"])
+
+        placements = row["placements"]
+        _event_results_cache.put(event_id, placements)
 
-    return {"league_id": league_id, "event_id": event_id, "placements": [dict(r) for r in rows]}
+    return ORJSONResponse({"league_id": league_id, "event_id": event_id, "placements": placements})
 
 
 @router.get("/leaderboard")
 def leaderboard(
     league_id: str,
+    limit: int | None = None,
+    offset: int = 0,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    _require_member(db, league_id, user["id"])
-    _ensure_global_results_table(db)
-
-    # points = sum over picks that match results by (league,event,entry_key)
-    rows = db.execute(
-        text(
-            """
-            select
-              u.id as user_id,
-              u.username as username,
-              coalesce(sum(
-                case r.place
-                  when 1 then 8
-                  when 2 then 5
-                  when 3 then 3
-                  when 4 then 1
-                  when 5 then 1
-                  when 6 then 1
-                  when 7 then 1
-                  when 8 then 1
-                  when 9 then 1
-                  when 10 then 1
-                  else 0
-                end
-              ), 0) as points
-            from public.league_members m
-            join public.users u
-              on u.id = m.user_id
-            left join public.draft_picks p
-              on p.league_id = m.league_id
-             and p.user_id = m.user_id
-            left join public.global_event_results r
-              on r.event_id = p.event_id
-              and r.entry_key = split_part(p.entry_key, '__AUTO_DUP__', 1)
-            where m.league_id = :lid
-            group by u.id, u.username
-            order by points desc, u.username asc
-            """
-        ),
-        {"lid": league_id},
-    ).mappings().all()
-
-    return {"league_id": league_id, "scoring": POINTS, "rows": [dict(r) for r in rows]}
+    """
+    Whole league by default; pass limit/offset for one page. `me` is always the caller's own row.
+    """
+    rows = _leaderboard_cache.get(league_id)
+    if rows is not None:
+        require_league_member(db, league_id, user["id"])
+    else:
+        # points = sum over picks that match results by (league,event,entry_key).
+        # No rows means the caller is not a member (a member always sees themselves).
+        rows = [
+            dict(r)
+            for r in db.execute(
+                _Q_LEADERBOARD,
+                {"lid": league_id, "uid": user["id"], "places": _POINT_PLACES, "points": _POINT_VALUES},
+            ).mappings()
+        ]
+        if not rows:
+            raise HTTPException(status_code=403, detail="Not a member of this league")
+        remember_league_member(league_id, user["id"])
+        _leaderboard_cache.put(league_id, rows)
+
+    uid = str(user["id"])
+    me = next((r for r in rows if str(r["user_id"]) == uid), None)
+
+    offset = max(offset, 0)
+    page = rows[offset:] if limit is None else rows[offset : offset + max(1, min(limit, 200))]
+
+    return ORJSONResponse({"league_id": league_id, "scoring": POINTS, "rows": page, "me": me})
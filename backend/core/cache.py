@@ -0,0 +1,48 @@
+# backend/core/cache.py
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TTLCache:
+    """
+    Small process-local cache with per-entry expiry and a size cap.
+    Sync routes run on a threadpool, so access is guarded by a lock.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires_at, value = hit
+            if expires_at <= time.time():
+                self._data.pop(key, None)
+                return None
+            return value
+
+    def put(self, key, value, expires_at: float | None = None) -> None:
+        now = time.time()
+        expires_at = min(now + self.ttl, expires_at) if expires_at is not None else now + self.ttl
+        if expires_at <= now:
+            return
+
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                # Drop expired entries first, then the oldest ones.
+                for k in [k for k, (e, _) in self._data.items() if e <= now]:
+                    del self._data[k]
+                while len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (expires_at, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
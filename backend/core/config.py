@@ -8,6 +8,12 @@ def _parse_frontend_origins(value: str) -> list[str]:
     origins = [origin.strip() for origin in value.split(",") if origin.strip()]
     return origins or ["http://localhost:3000"]
 
+def _parse_optional_int(value: str) -> int | None:
+    value = value.strip().lower()
+    if value in ("", "none", "off"):
+        return None
+    return int(value)
+
 @dataclass(frozen=True)
 class Settings:
     database_url: str = os.getenv("DATABASE_URL", "")
@@ -18,6 +24,17 @@ class Settings:
     )
     results_admin_username: str = os.getenv("RESULTS_ADMIN_USERNAME", "").strip()
     results_admin_password: str = os.getenv("RESULTS_ADMIN_PASSWORD", "")
+    # Worker threads for sync routes (FastAPI/anyio default is 40)
+    threadpool_size: int = int(os.getenv("THREADPOOL_SIZE", "100"))
+    # psycopg server-side prepare threshold; "none" disables it (needed behind PgBouncer transaction pooling)
+    db_prepare_threshold: int | None = _parse_optional_int(os.getenv("DB_PREPARE_THRESHOLD", "5"))
+    # SQLAlchemy pool; sync routes hold a connection for the whole request
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Seconds before a pooled connection is replaced, ahead of server/proxy idle cutoffs
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+    # Seconds a confirmed league membership is trusted without re-querying
+    league_member_cache_ttl: int = int(os.getenv("LEAGUE_MEMBER_CACHE_TTL", "60"))
 
 settings = Settings()
 
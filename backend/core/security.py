@@ -6,11 +6,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
 import jwt
-from passlib.context import CryptContext
-from jwt import PyJWTError
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from jwt import PyJWK, PyJWTError
+from jwt.algorithms import HMACAlgorithm
 
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# argon2id with the same cost parameters passlib used, so existing hashes verify unchanged.
+_password_hasher = PasswordHasher(time_cost=3, memory_cost=64 * 1024, parallelism=4)
 
 JWT_SECRET = os.getenv("JWT_SECRET", "")
 JWT_ALG = os.getenv("JWT_ALG", "HS256")
@@ -19,16 +22,34 @@ if not JWT_SECRET:
     raise RuntimeError("JWT_SECRET missing in backend/.env")
 
 
+def _build_verify_key() -> PyJWK | str:
+    """
+    Parse the verification key once at import.
+    jwt.decode() re-runs prepare_key on a raw secret every call but uses a PyJWK as-is.
+    """
+    alg = jwt.get_algorithm_by_name(JWT_ALG)
+    if not isinstance(alg, HMACAlgorithm):
+        return JWT_SECRET
+    return PyJWK(alg.to_jwk(alg.prepare_key(JWT_SECRET), as_dict=True), JWT_ALG)
+
+
+_VERIFY_KEY = _build_verify_key()
+_ALLOWED_ALGS = [JWT_ALG]
+
+
 # -------------------------
 # Password helpers
 # -------------------------
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, password_hash: str) -> bool:
-    return pwd_context.verify(plain_password, password_hash)
+    try:
+        return _password_hasher.verify(password_hash, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 # -------------------------
@@ -64,7 +85,7 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises jwt.PyJWTError if invalid or expired.
     """
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALG])
+        payload = jwt.decode(token, _VERIFY_KEY, algorithms=_ALLOWED_ALGS)
         return payload
     except PyJWTError:
         # Let the caller decide how to turn this into HTTP 401
@@ -0,0 +1,19 @@
+# backend/db/errors.py
+from __future__ import annotations
+
+from sqlalchemy.exc import IntegrityError
+
+UNIQUE_VIOLATION = "23505"
+
+
+def is_unique_violation(exc: IntegrityError) -> bool:
+    return getattr(exc.orig, "sqlstate", None) == UNIQUE_VIOLATION
+
+
+def constraint_name(exc: IntegrityError) -> str:
+    """
+    Name of the constraint a psycopg error tripped ("" if unknown).
+    Reads the server's diagnostics instead of rendering the error message.
+    """
+    diag = getattr(exc.orig, "diag", None)
+    return (getattr(diag, "constraint_name", None) or "").lower()
@@ -1,10 +1,49 @@
 # backend/db/init_db.py
+from sqlalchemy import text
+
 from db.session import engine
 from db.models import Base
 
+
+def ensure_extensions(conn) -> None:
+    # pg_trgm backs the trigram index on event_entries; must exist before create_all.
+    conn.execute(text("create extension if not exists pg_trgm"))
+
+
+def ensure_global_results_table(conn) -> None:
+    conn.execute(
+        text(
+            """
+            create table if not exists public.global_event_results (
+              id uuid primary key default gen_random_uuid(),
+              event_id uuid not null references public.events(id),
+              place int not null,
+              entry_key text not null,
+              entry_name text not null,
+              created_at timestamptz not null default now(),
+              unique (event_id, place),
+              unique (event_id, entry_key)
+            )
+            """
+        )
+    )
+
+
+def ensure_indexes(conn) -> None:
+    # create_all only builds indexes for brand-new tables; add any declared since.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
 def main():
+    with engine.begin() as conn:
+        ensure_extensions(conn)
     Base.metadata.create_all(bind=engine)
-    print("✅ Tables created (if they didn't already exist).")
+    with engine.begin() as conn:
+        ensure_global_results_table(conn)
+        ensure_indexes(conn)
+    print("✅ Tables and indexes created (if they didn't already exist).")
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,6 @@
 # backend/db/models.py
 from __future__ import annotations
 
-import uuid
 from sqlalchemy import (
     Column,
     Text,
@@ -10,10 +9,12 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     UniqueConstraint,
+    Index,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
@@ -21,7 +22,7 @@ Base = declarative_base()
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     username = Column(Text, nullable=False, unique=True, index=True)
     password_hash = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -30,7 +31,7 @@ class User(Base):
 class League(Base):
     __tablename__ = "leagues"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     code = Column(Text, nullable=False, unique=True, index=True)
     name = Column(Text, nullable=False)
     status = Column(Text, nullable=False, server_default="lobby")  # lobby | drafting | locked
@@ -42,15 +43,29 @@ class League(Base):
 class LeagueMember(Base):
     __tablename__ = "league_members"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    league_id = Column(UUID(as_uuid=True), ForeignKey("leagues.id"), nullable=False, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    # No single-column indexes: uq_league_member leads with league_id
+    # and ix_league_members_uid_lid with user_id.
+    league_id = Column(UUID(as_uuid=True), ForeignKey("leagues.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     draft_position = Column(Integer, nullable=True)
     joined_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     __table_args__ = (
-        UniqueConstraint("league_id", "user_id", name="uq_league_member"),
+        # One membership per user per league; carries the draft slot so member
+        # lookups that need it are answered from the index alone
+        Index(
+            "uq_league_member",
+            "league_id",
+            "user_id",
+            unique=True,
+            postgresql_include=["draft_position"],
+        ),
         UniqueConstraint("league_id", "draft_position", name="uq_league_draft_position"),
+        # /leagues/mine: a user's leagues without touching the heap
+        Index("ix_league_members_uid_lid", "user_id", postgresql_include=["league_id"]),
+        # Member lists in display order (draft_position nulls last, then join order)
+        Index("ix_league_members_order", "league_id", "draft_position", "joined_at", "user_id"),
     )
 
 
@@ -58,7 +73,7 @@ class LeagueMember(Base):
 class Event(Base):
     __tablename__ = "events"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     sport = Column(Text, nullable=False)
     name = Column(Text, nullable=False)
     event_key = Column(Text, nullable=False, unique=True)
@@ -72,7 +87,7 @@ class EventEntry(Base):
     """
     __tablename__ = "event_entries"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
 
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False, index=True)
 
@@ -87,6 +102,18 @@ class EventEntry(Base):
 
     __table_args__ = (
         UniqueConstraint("event_id", "entry_key", name="uq_event_entry_key"),
+        # /entries/for-event: filter by event + team flag, already sorted by name
+        Index("ix_event_entries_eid_team_name", "event_id", "is_team", "entry_name"),
+        # Case-insensitive athlete lookups in the global results import
+        Index("ix_event_entries_eid_lower_name", event_id, func.lower(entry_name)),
+        # Substring search in /entries/for-event (ILIKE '%q%'); needs pg_trgm
+        Index(
+            "ix_event_entries_trgm",
+            "entry_name",
+            "entry_key",
+            postgresql_using="gin",
+            postgresql_ops={"entry_name": "gin_trgm_ops", "entry_key": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -109,6 +136,13 @@ class LeagueEvent(Base):
 
     __table_args__ = (
         UniqueConstraint("league_id", "event_id", name="uq_league_event"),
+        # Draft state reads only a league's draft rounds, in order, on every request
+        Index(
+            "ix_league_events_lid_sort_draft",
+            "league_id",
+            "sort_order",
+            postgresql_where=text("mode = 'draft'"),
+        ),
     )
 
 
@@ -119,10 +153,12 @@ class DraftPick(Base):
     """
     __tablename__ = "draft_picks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    league_id = Column(UUID(as_uuid=True), ForeignKey("leagues.id"), nullable=False, index=True)
-    event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    # No single-column indexes: every read filters on league_id plus event_id or user_id,
+    # which the composite indexes below already cover.
+    league_id = Column(UUID(as_uuid=True), ForeignKey("leagues.id"), nullable=False)
+    event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     # “entry_key” is the unique identifier you decide for an athlete/team/country (string).
     entry_key = Column(Text, nullable=False)
@@ -133,6 +169,22 @@ class DraftPick(Base):
     __table_args__ = (
         UniqueConstraint("league_id", "event_id", "user_id", name="uq_pick_user_per_event"),
         UniqueConstraint("league_id", "event_id", "entry_key", name="uq_pick_no_dupe_entry"),
+        # Per-event pick lists in draft state, already in pick order and answered from the index alone
+        Index(
+            "ix_draft_picks_lid_eid_picked_cover",
+            "league_id",
+            "event_id",
+            "picked_at",
+            postgresql_include=["user_id", "entry_key", "entry_name"],
+        ),
+        # /me/picks and the leaderboard: one member's picks, answered from the index alone
+        Index(
+            "ix_draft_picks_lid_uid_eid",
+            "league_id",
+            "user_id",
+            "event_id",
+            postgresql_include=["entry_key", "entry_name", "picked_at"],
+        ),
     )
 
 
@@ -143,8 +195,8 @@ class LeagueEventResult(Base):
     """
     __tablename__ = "league_event_results"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    league_id = Column(UUID(as_uuid=True), ForeignKey("leagues.id"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    league_id = Column(UUID(as_uuid=True), ForeignKey("leagues.id"), nullable=False)
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False, index=True)
 
     place = Column(Integer, nullable=False)  # 1..8
@@ -154,6 +206,7 @@ class LeagueEventResult(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     __table_args__ = (
+        # Also serves (league_id, event_id) lookups; league_id alone needs no extra index.
         UniqueConstraint("league_id", "event_id", "place", name="uq_result_place"),
         UniqueConstraint("league_id", "event_id", "entry_key", name="uq_result_no_dupe_entry"),
     )
@@ -165,7 +218,7 @@ class GlobalEventResult(Base):
     """
     __tablename__ = "global_event_results"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False, index=True)
     place = Column(Integer, nullable=False)  # 1..10
     entry_key = Column(Text, nullable=False)
@@ -1,11 +1,12 @@
 # backend/db/reset_events.py
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-from sqlalchemy import text
+import orjson
+from sqlalchemy import insert, text
+from db.models import Event
 from db.session import engine
 
 
@@ -16,14 +17,16 @@ def _load_events(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"events.json not found at: {path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(path.read_bytes())
 
     if not isinstance(data, list):
         raise ValueError("events.json must be a list of event objects")
 
-    # Basic validation + normalize expected keys
+    # Basic validation + normalize expected keys.
+    # Uniqueness is checked in the same pass (helps catch silent partial loads later).
     cleaned: List[Dict[str, Any]] = []
+    seen_keys: set[str] = set()
+    seen_orders: set[int] = set()
     for i, ev in enumerate(data):
         if not isinstance(ev, dict):
             raise ValueError(f"events.json item {i} is not an object")
@@ -41,25 +44,25 @@ def _load_events(path: Path) -> List[Dict[str, Any]]:
                 f"Need sport,name,event_key,sort_order. Got: {ev}"
             )
 
+        event_key = str(event_key)
+        sort_order = int(sort_order)
+        if event_key in seen_keys:
+            raise ValueError(f"Duplicate event_key found in events.json: {event_key}")
+        if sort_order in seen_orders:
+            raise ValueError(f"Duplicate sort_order found in events.json: {sort_order}")
+        seen_keys.add(event_key)
+        seen_orders.add(sort_order)
+
         cleaned.append(
             {
                 "sport": str(sport),
                 "name": str(name),
-                "event_key": str(event_key),
+                "event_key": event_key,
                 "is_team_event": bool(is_team_event),
-                "sort_order": int(sort_order),
+                "sort_order": sort_order,
             }
         )
 
-    # Uniqueness checks (helps catch silent partial loads later)
-    keys = [e["event_key"] for e in cleaned]
-    if len(keys) != len(set(keys)):
-        raise ValueError("Duplicate event_key found in events.json")
-
-    orders = [e["sort_order"] for e in cleaned]
-    if len(orders) != len(set(orders)):
-        raise ValueError("Duplicate sort_order found in events.json")
-
     return cleaned
 
 
@@ -74,27 +77,26 @@ def reset_and_seed_events() -> Tuple[int, int]:
         # Count existing (just for reporting)
         old_count = conn.execute(text("select count(*) as c from public.events")).mappings().first()["c"]
 
-        # Delete dependent tables first (FK-safe order)
-        # Note: include league_events because it references events.
-        conn.execute(text("delete from public.league_events"))
-        conn.execute(text("delete from public.draft_picks"))
-        conn.execute(text("delete from public.league_event_results"))
-        conn.execute(text("delete from public.event_entries"))
-
-        # Now delete events
-        conn.execute(text("delete from public.events"))
-
-        # Insert fresh events
+        # One truncate clears events and everything that references them.
+        # CASCADE handles the FK order (and global_event_results, which also points at events).
         conn.execute(
             text(
                 """
-                insert into public.events (sport, name, event_key, is_team_event, sort_order)
-                values (:sport, :name, :event_key, :is_team_event, :sort_order)
+                truncate table
+                  public.league_events,
+                  public.draft_picks,
+                  public.league_event_results,
+                  public.event_entries,
+                  public.events
+                restart identity
+                cascade
                 """
-            ),
-            events,
+            )
         )
 
+        # Insert fresh events; with no RETURNING this is one executemany, which psycopg batches itself.
+        conn.execute(insert(Event), events)
+
         new_count = conn.execute(text("select count(*) as c from public.events")).mappings().first()["c"]
 
     return int(old_count), int(new_count)
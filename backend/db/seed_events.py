@@ -6,10 +6,10 @@ Uses DATABASE_URL (postgresql+psycopg://...)
 
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
 
+import orjson
 import psycopg
 from dotenv import load_dotenv
 
@@ -33,7 +33,7 @@ def main() -> None:
 
     database_url = require_env("DATABASE_URL")
 
-    events = json.loads(EVENTS_JSON_PATH.read_text(encoding="utf-8"))
+    events = orjson.loads(EVENTS_JSON_PATH.read_bytes())
 
     required = {"sport", "name", "event_key", "is_team_event", "sort_order"}
     for i, e in enumerate(events):
@@ -45,46 +45,65 @@ def main() -> None:
     # Strip "+psycopg" if present
     database_url = database_url.replace("postgresql+psycopg://", "postgresql://")
 
-    with psycopg.connect(database_url) as conn:
+    # One connection and one transaction: the upsert and the sanity count
+    # share a single commit.
+    with psycopg.connect(database_url, autocommit=False) as conn:
         with conn.cursor() as cur:
-            for e in events:
-                cur.execute(
-                    """
-                    insert into public.events (
-                        sport,
-                        name,
-                        event_key,
-                        is_team_event,
-                        sort_order
+            # COPY every event into a staging table in one stream, then upsert them
+            # all with a single statement instead of one INSERT per event.
+            cur.execute(
+                """
+                create temp table _events_stage (
+                    sport text,
+                    name text,
+                    event_key text,
+                    is_team_event boolean,
+                    sort_order int
+                ) on commit drop
+                """
+            )
+            with cur.copy(
+                "copy _events_stage (sport, name, event_key, is_team_event, sort_order) from stdin"
+            ) as copy:
+                for e in events:
+                    copy.write_row(
+                        (
+                            e["sport"],
+                            e["name"],
+                            e["event_key"],
+                            e["is_team_event"],
+                            e["sort_order"],
+                        )
                     )
-                    values (%s, %s, %s, %s, %s)
-                    on conflict (event_key) do update
-                    set
-                        sport = excluded.sport,
-                        name = excluded.name,
-                        is_team_event = excluded.is_team_event,
-                        sort_order = excluded.sort_order
-                    """,
-                    (
-                        e["sport"],
-                        e["name"],
-                        e["event_key"],
-                        e["is_team_event"],
-                        e["sort_order"],
-                    ),
+
+            cur.execute(
+                """
+                insert into public.events (
+                    sport,
+                    name,
+                    event_key,
+                    is_team_event,
+                    sort_order
                 )
+                select sport, name, event_key, is_team_event, sort_order
+                from _events_stage
+                on conflict (event_key) do update
+                set
+                    sport = excluded.sport,
+                    name = excluded.name,
+                    is_team_event = excluded.is_team_event,
+                    sort_order = excluded.sort_order
+                """
+            )
+
+            # quick sanity check
+            cur.execute("select count(*) from public.events;")
+            count = cur.fetchone()[0]
 
         conn.commit()
 
     print(f"Seeded {len(events)} events into public.events.")
-
-    # quick sanity check
-    with psycopg.connect(database_url) as conn:
-        with conn.cursor() as cur:
-            cur.execute("select count(*) from public.events;")
-            count = cur.fetchone()[0]
-            print(f"public.events now contains {count} rows.")
-
+    print(f"public.events now contains {count} rows.")
 
 if __name__ == "__main__":
     main()
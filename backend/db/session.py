@@ -5,6 +5,11 @@ from core.config import settings
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    query_cache_size=1200,
+    connect_args={"prepare_threshold": settings.db_prepare_threshold},
 )
 
 SessionLocal = sessionmaker(
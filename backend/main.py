@@ -1,22 +1,57 @@
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
 from core.config import settings
+from db.init_db import ensure_extensions, ensure_global_results_table
+from db.models import Base
+from db.session import engine
 
 from api.routes.auth import router as auth_router
 from api.routes.me import router as me_router
 from api.routes.leagues import router as leagues_router
-from api.routes.events import router as events_router
+from api.routes.events import reload_events, router as events_router
 from api.routes.draft import router as draft_router
 from api.routes.results import router as results_router
 from api.routes.admin import router as admin_router
 from api.routes import entries
 
 
-from fastapi.security import OAuth2PasswordBearer
+_Q_SCHEMA_BOOTSTRAP_LOCK = text("select pg_advisory_xact_lock(hashtext('ylolympicdraft.schema_bootstrap'))")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync routes (including argon2 hashing in /auth) run on anyio's threadpool;
+    # size it so concurrent logins/registers don't starve other requests.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
+    # Configure the mappers up front so a bad model fails at boot, not on first use.
+    Base.registry.configure()
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-app = FastAPI(title="YL Olympic Draft API", swagger_ui_parameters={"persistAuthorization": True})
+    # Schema bootstrap runs once per process, not on every request. The advisory lock
+    # (released at commit) keeps replicas starting together from racing the DDL.
+    with engine.begin() as conn:
+        conn.execute(_Q_SCHEMA_BOOTSTRAP_LOCK)
+        ensure_extensions(conn)
+        ensure_global_results_table(conn)
+
+    # Pin the (static) events list before serving traffic
+    with engine.connect() as conn:
+        reload_events(conn)
+    yield
+
+
+app = FastAPI(
+    title="YL Olympic Draft API",
+    swagger_ui_parameters={"persistAuthorization": True},
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -8,12 +8,14 @@ Run:
 
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
 from collections import Counter
+from functools import lru_cache
+from typing import Iterable, Iterator
 
 import fitz  # PyMuPDF
+import orjson
 
 
 # ---- PATHS ----
@@ -22,7 +24,7 @@ OUT_PATH = Path(__file__).resolve().parent / "db" / "data" / "events.json"
 
 
 # ---- SPORTS ----
-SPORTS = {
+SPORTS = frozenset({
     "Alpine Skiing",
     "Biathlon",
     "Bobsleigh",
@@ -39,11 +41,11 @@ SPORTS = {
     "Skeleton",
     "Snowboard",
     "Speed Skating",
-}
+})
 
 
 # ---- FILTERING RULES ----
-DROP_CONTAINS = [
+DROP_CONTAINS = (
     "Qualification", "Qualifying",
     "Heat", "Heats",
     "Quarterfinal", "Quarterfinals",
@@ -55,31 +57,86 @@ DROP_CONTAINS = [
     "Total",
     "Park",
     "Livigno", "Cortina", "Milano", "Anterselva", "Predazzo", "Tesero",
-]
+)
 
-DROP_EXACT = {
+DROP_EXACT = frozenset({
     "Women", "Men", "Mixed",
     "Final", "Finals",
     "Opening Ceremony", "Closing Ceremony",
     "&",
-}
+})
 
-GENERIC_EVENT_WORDS = {
+GENERIC_EVENT_WORDS = frozenset({
     "Downhill", "Slalom", "Giant Slalom", "Super-G",
     "Moguls", "Dual Moguls", "Aerials",
     "Slopestyle", "Halfpipe", "Big Air", "Ski Cross",
-}
+})
 
-NEUTRAL_OK = {
+NEUTRAL_OK = frozenset({
     "Ice Dance",
     "Team Event",
     "Mixed Doubles",
-}
+})
 
-TEAM_EVENT_KEYWORDS = ["team", "relay", "pairs", "pair", "doubles", "mixed", "tournament"]
+TEAM_EVENT_KEYWORDS = ("team", "relay", "pairs", "pair", "doubles", "mixed", "tournament")
+
+# ---- HARD NORMALIZATION ----
+# Sports whose scraped events are thrown away and replaced by HARD_ADDS
+HARD_CLEAR_SPORTS = frozenset({
+    "Nordic Combined",
+    "Bobsleigh",
+    "Skeleton",
+    "Luge",
+    "Ice Hockey",
+})
+
+# Events the PDF misses or mangles, appended (if not already seen) in this order
+HARD_ADDS: tuple[tuple[str, str], ...] = (
+    # Nordic Combined (3)
+    ("Nordic Combined", "Men's Individual (Normal Hill)"),
+    ("Nordic Combined", "Men's Individual (Large Hill)"),
+    ("Nordic Combined", "Men's Team Sprint"),
+    # Curling (3)
+    ("Curling", "Men's Tournament"),
+    ("Curling", "Women's Tournament"),
+    # Figure Skating (5)
+    ("Figure Skating", "Men's Singles"),
+    ("Figure Skating", "Women's Singles"),
+    ("Figure Skating", "Pairs"),
+    ("Figure Skating", "Ice Dance"),
+    ("Figure Skating", "Team Event"),
+    # Bobsleigh (4)
+    ("Bobsleigh", "Men's Two-man"),
+    ("Bobsleigh", "Women's Two-woman"),
+    ("Bobsleigh", "Men's Four-man"),
+    ("Bobsleigh", "Women's Monobob"),
+    # Skeleton (3)
+    ("Skeleton", "Men's Singles"),
+    ("Skeleton", "Women's Singles"),
+    ("Skeleton", "Mixed Team"),
+    # Luge (5)
+    ("Luge", "Men's Singles"),
+    ("Luge", "Women's Singles"),
+    ("Luge", "Men's Doubles"),
+    ("Luge", "Women's Doubles"),
+    ("Luge", "Team Relay"),
+    # Ice Hockey (2)
+    ("Ice Hockey", "Men's Tournament"),
+    ("Ice Hockey", "Women's Tournament"),
+)
+
+# Compiled once; should_drop/looks_like_event run for every line of the PDF.
+_RE_TIME = re.compile(r"\b\d{1,2}:\d{2}\b")
+_RE_CC_PAIR = re.compile(r"[A-Z]{3}-[A-Z]{3}")
+_RE_NUM_PAIR = re.compile(r"#\d+-#\d+")
+_RE_GENDER = re.compile(r"\bMen'?s\b|\bWomen'?s\b|\bMixed\b")
+# Every DROP_CONTAINS needle in one case-insensitive pass over the line
+_RE_DROP = re.compile("|".join(map(re.escape, DROP_CONTAINS)), re.IGNORECASE)
 
 
 # ---- HELPERS ----
+# slugify/is_team_event are pure and see the same sport and event names over and over.
+@lru_cache(maxsize=4096)
 def slugify(s: str) -> str:
     s = s.strip().lower()
     s = s.replace("&", "and")
@@ -88,6 +145,7 @@ def slugify(s: str) -> str:
     return re.sub(r"_+", "_", s).strip("_")
 
 
+@lru_cache(maxsize=4096)
 def is_team_event(sport: str, name: str) -> bool:
     x = f"{sport} {name}".lower()
     if sport in {"Ice Hockey", "Curling"}:
@@ -102,64 +160,69 @@ def normalize(s: str) -> str:
 def should_drop(name: str) -> bool:
     if not name or name in DROP_EXACT:
         return True
-    for bad in DROP_CONTAINS:
-        if bad.lower() in name.lower():
-            return True
+    if _RE_DROP.search(name):
+        return True
     if name.startswith("&"):
         return True
-    if re.search(r"\b\d{1,2}:\d{2}\b", name):
+    if _RE_TIME.search(name):
         return True
-    if re.fullmatch(r"[A-Z]{3}-[A-Z]{3}", name):
+    if _RE_CC_PAIR.fullmatch(name):
         return True
-    if re.fullmatch(r"#\d+-#\d+", name.replace(" ", "")):
+    if _RE_NUM_PAIR.fullmatch(name.replace(" ", "")):
         return True
     return False
 
 
-def extract_text(pdf_path: Path) -> str:
+def extract_lines(pdf_path: Path) -> Iterator[str]:
+    """
+    Normalized, non-empty lines of the PDF, read one page at a time
+    instead of joining the whole document into one string first.
+    """
     doc = fitz.open(pdf_path)
     try:
-        return "\n".join(page.get_text("text") for page in doc)
+        for page in doc:
+            for line in page.get_text("text").splitlines():
+                if line.strip():
+                    yield normalize(line)
     finally:
         doc.close()
 
 
-def stitch_lines(lines: list[str]) -> list[str]:
-    out = []
-    i = 0
-    while i < len(lines):
-        cur = normalize(lines[i])
+def stitch_lines(lines: Iterable[str]) -> Iterator[str]:
+    # Pull-based with a one-line look-ahead, so the input can be a generator.
+    it = iter(lines)
+    nxt_raw = next(it, None)
+    while nxt_raw is not None:
+        cur = normalize(nxt_raw)
+        nxt_raw = next(it, None)
         if not cur:
-            i += 1
             continue
 
         # Expand "Women's and Men's X"
-        if cur == "Women's and Men's" and i + 1 < len(lines):
-            nxt = normalize(lines[i + 1])
+        if cur == "Women's and Men's" and nxt_raw is not None:
+            nxt = normalize(nxt_raw)
             if nxt not in SPORTS:
-                out.append(f"Women's {nxt}")
-                out.append(f"Men's {nxt}")
-                i += 2
+                yield f"Women's {nxt}"
+                yield f"Men's {nxt}"
+                nxt_raw = next(it, None)
                 continue
 
         # Join split tokens
         if cur in {"Women's", "Men's", "Mixed"} or cur.endswith(("+", "-", "and", "–", "(")):
-            if i + 1 < len(lines):
-                nxt = normalize(lines[i + 1])
+            if nxt_raw is not None:
+                nxt = normalize(nxt_raw)
                 if nxt not in SPORTS:
-                    out.append(f"{cur} {nxt}")
-                    i += 2
+                    yield f"{cur} {nxt}"
+                    nxt_raw = next(it, None)
                     continue
 
-        out.append(cur)
-        i += 1
-    return out
+        yield cur
 
 
 def looks_like_event(sport: str, name: str) -> bool:
     if name in NEUTRAL_OK:
         return True
-    if re.search(r"\bMen'?s\b|\bWomen'?s\b|\bMixed\b", name):
+    if _RE_GENDER.search(name):
         return True
     if sport == "Nordic Combined" and any(k in name for k in ["Individual", "Team Sprint", "Gundersen"]):
         return True
@@ -168,11 +231,11 @@ def looks_like_event(sport: str, name: str) -> bool:
 
 # ---- MAIN ----
 def main():
-    text = extract_text(PDF_PATH)
-    lines = stitch_lines([normalize(l) for l in text.splitlines() if l.strip()])
+    lines = stitch_lines(extract_lines(PDF_PATH))
 
     events = []
-    seen = set()
+    # Dedupe on (sport slug, name slug); the event_key string is only built for new events.
+    seen: set[tuple[str, str]] = set()
     current_sport = None
 
     for line in lines:
@@ -188,13 +251,13 @@ def main():
                 name = f"{sex} {tail}"
                 if should_drop(name) or name in GENERIC_EVENT_WORDS:
                     continue
-                key = f"{slugify(current_sport)}_{slugify(name)}"
-                if key not in seen:
-                    seen.add(key)
+                cand = (slugify(current_sport), slugify(name))
+                if cand not in seen:
+                    seen.add(cand)
                     events.append({
                         "sport": current_sport,
                         "name": name,
-                        "event_key": key,
+                        "event_key": f"{cand[0]}_{cand[1]}",
                         "is_team_event": is_team_event(current_sport, name),
                     })
             continue
@@ -204,84 +267,39 @@ def main():
         if not looks_like_event(current_sport, line):
             continue
 
-        key = f"{slugify(current_sport)}_{slugify(line)}"
-        if key in seen:
+        cand = (slugify(current_sport), slugify(line))
+        if cand in seen:
             continue
-        seen.add(key)
+        seen.add(cand)
         events.append({
             "sport": current_sport,
             "name": line,
-            "event_key": key,
+            "event_key": f"{cand[0]}_{cand[1]}",
             "is_team_event": is_team_event(current_sport, line),
         })
 
 
     # ---- HARD NORMALIZATION (FINAL 116) ----
-    def clear_sport(sport):
-        nonlocal events, seen
-        events = [e for e in events if e["sport"] != sport]
-        seen = {e["event_key"] for e in events}
-
-    def add(sport, name):
-        key = f"{slugify(sport)}_{slugify(name)}"
-        if key not in seen:
-            seen.add(key)
+    # Replace what the PDF gave us for some sports, then top up the known events.
+    events = [e for e in events if e["sport"] not in HARD_CLEAR_SPORTS]
+    seen = {(slugify(e["sport"]), slugify(e["name"])) for e in events}
+    for sport, name in HARD_ADDS:
+        cand = (slugify(sport), slugify(name))
+        if cand not in seen:
+            seen.add(cand)
             events.append({
                 "sport": sport,
                 "name": name,
-                "event_key": key,
+                "event_key": f"{cand[0]}_{cand[1]}",
                 "is_team_event": is_team_event(sport, name),
             })
 
-    # Nordic Combined (3)
-    clear_sport("Nordic Combined")
-    add("Nordic Combined", "Men's Individual (Normal Hill)")
-    add("Nordic Combined", "Men's Individual (Large Hill)")
-    add("Nordic Combined", "Men's Team Sprint")
-
-    # Curling (3)
-    add("Curling", "Men's Tournament")
-    add("Curling", "Women's Tournament")
-
-    # Figure Skating (5)
-    add("Figure Skating", "Men's Singles")
-    add("Figure Skating", "Women's Singles")
-    add("Figure Skating", "Pairs")
-    add("Figure Skating", "Ice Dance")
-    add("Figure Skating", "Team Event")
-
-    # Bobsleigh (4)
-    clear_sport("Bobsleigh")
-    add("Bobsleigh", "Men's Two-man")
-    add("Bobsleigh", "Women's Two-woman")
-    add("Bobsleigh", "Men's Four-man")
-    add("Bobsleigh", "Women's Monobob")
-
-    # Skeleton (3)
-    clear_sport("Skeleton")
-    add("Skeleton", "Men's Singles")
-    add("Skeleton", "Women's Singles")
-    add("Skeleton", "Mixed Team")
-
-    # Luge (5)
-    clear_sport("Luge")
-    add("Luge", "Men's Singles")
-    add("Luge", "Women's Singles")
-    add("Luge", "Men's Doubles")
-    add("Luge", "Women's Doubles")
-    add("Luge", "Team Relay")
-
-    # Ice Hockey (2)
-    clear_sport("Ice Hockey")
-    add("Ice Hockey", "Men's Tournament")
-    add("Ice Hockey", "Women's Tournament")
-
     # ---- FINAL ORDERING ----
     for i, e in enumerate(events, start=1):
         e["sort_order"] = i
 
     OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUT_PATH.write_text(json.dumps(events, indent=2), encoding="utf-8")
+    OUT_PATH.write_bytes(orjson.dumps(events, option=orjson.OPT_INDENT_2))
 
     print(f"Wrote {len(events)} events -> {OUT_PATH}")
     counts = Counter(e["sport"] for e in events)
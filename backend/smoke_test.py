@@ -1,78 +1,119 @@
+import logging
 import os
 import sys
 import time
-import random
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = os.getenv("BASE_URL", "http://127.0.0.1:8000").rstrip("/")
 EVENTS_TO_DRAFT = int(os.getenv("EVENTS_TO_DRAFT", "2"))  # how many events to draft in this test
-SEED = int(os.getenv("SEED", "42"))  # deterministic randomness for entry names/keys
 
 # If you already created these usernames before, change the prefix
 USER_PREFIX = os.getenv("USER_PREFIX", "smoke")
 
-
-def req(method: str, path: str, token: str | None = None, **kwargs):
+# Seconds to open a connection / wait for a response. Connect fails fast; read leaves
+# headroom for argon2 on /auth and a cold-starting host.
+CONNECT_TIMEOUT = float(os.getenv("CONNECT_TIMEOUT", "1.0"))
+READ_TIMEOUT = float(os.getenv("READ_TIMEOUT", "10.0"))
+
+# Per-pick lines are DEBUG; set LOG_LEVEL=DEBUG to see them. Milestones still print.
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s")
+log = logging.getLogger("smoke")
+
+# Bounded exponential backoff with jitter for transient failures. Connection errors
+# are retried for any method (nothing reached the server); 5xx and read errors only
+# for GETs, so a POST like /draft/pick is never replayed after the server saw it.
+RETRY = Retry(
+    total=3,
+    connect=3,
+    read=3,
+    status=3,
+    backoff_factor=0.2,
+    backoff_max=5,
+    backoff_jitter=0.2,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
+# One keep-alive session for the whole run; every call goes to the same BASE_URL.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=RETRY)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+class HTTPError(RuntimeError):
+    def __init__(self, method: str, path: str, status: int, body):
+        super().__init__(f"{method} {path} -> {status}: {body}")
+        self.status = status
+        self.body = body
+
+
+def req(method: str, path: str, token: str | None = None, json=None, **kwargs):
+    """
+    Sends one request and returns the decoded JSON body.
+    Bodies are encoded/decoded with orjson rather than requests' stdlib json.
+    """
     url = f"{BASE_URL}{path}"
     headers = kwargs.pop("headers", {})
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    r = requests.request(method, url, headers=headers, timeout=20, **kwargs)
+    if json is not None:
+        headers["Content-Type"] = "application/json"
+        kwargs["data"] = orjson.dumps(json)
+    r = SESSION.request(method, url, headers=headers, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), **kwargs)
     if r.status_code >= 400:
         # Helpful debug output
         try:
-            body = r.json()
-        except Exception:
+            body = orjson.loads(r.content)
+        except orjson.JSONDecodeError:
             body = r.text
-        raise RuntimeError(f"{method} {path} -> {r.status_code}: {body}")
-    return r
+        raise HTTPError(method, path, r.status_code, body)
+    return orjson.loads(r.content)
 
 
 def register_or_login(username: str, password: str) -> str:
-    # Try register; if conflict, login
+    # Try register; if the username is taken (409), login
     try:
-        r = req("POST", "/auth/register", json={"username": username, "password": password})
-        return r.json()["access_token"]
-    except RuntimeError as e:
-        if "409" not in str(e) and "Username already taken" not in str(e):
-            # not the expected "already exists"
-            pass
-        r = req("POST", "/auth/login", json={"username": username, "password": password})
-        return r.json()["access_token"]
+        body = req("POST", "/auth/register", json={"username": username, "password": password})
+    except HTTPError as e:
+        if e.status != 409:
+            raise
+        body = req("POST", "/auth/login-json", json={"username": username, "password": password})
+    return body["access_token"]
 
 
 def create_league(token: str, name: str) -> dict:
-    r = req("POST", "/leagues/create", token=token, json={"name": name})
-    return r.json()
+    return req("POST", "/leagues/create", token=token, json={"name": name})
 
 
 def join_league(token: str, code: str) -> dict:
-    r = req("POST", "/leagues/join", token=token, json={"code": code})
-    return r.json()
+    return req("POST", "/leagues/join", token=token, json={"code": code})
 
 
 def start_draft(token: str, league_id: str) -> dict:
-    r = req("POST", f"/leagues/{league_id}/start", token=token)
-    return r.json()
+    return req("POST", f"/leagues/{league_id}/start", token=token)
 
 
 def lock_league(token: str, league_id: str) -> dict:
-    r = req("POST", f"/leagues/{league_id}/lock", token=token)
-    return r.json()
+    return req("POST", f"/leagues/{league_id}/lock", token=token)
 
 
 def list_events() -> list[dict]:
-    r = req("GET", "/events/")
-    return r.json()
+    return req("GET", "/events/")
 
 
 def draft_state(token: str, league_id: str) -> dict:
-    r = req("GET", f"/draft/state?league_id={league_id}", token=token)
-    return r.json()
+    return req("GET", f"/draft/state?league_id={league_id}", token=token)
 
 
 def make_pick(token: str, league_id: str, entry_key: str, entry_name: str) -> dict:
-    r = req(
+    return req(
         "POST",
         "/draft/pick",
         token=token,
@@ -82,34 +123,27 @@ def make_pick(token: str, league_id: str, entry_key: str, entry_name: str) -> di
             "entry_name": entry_name,
         },
     )
-    return r.json()
 
 
 def submit_results(token: str, league_id: str, event_id: str, placements: list[dict]) -> dict:
-    r = req(
+    return req(
         "POST",
         "/results/submit",
         token=token,
         json={"league_id": league_id, "event_id": event_id, "placements": placements},
     )
-    return r.json()
 
 
 def leaderboard(token: str, league_id: str) -> dict:
-    r = req("GET", f"/results/leaderboard?league_id={league_id}", token=token)
-    return r.json()
+    return req("GET", f"/results/leaderboard?league_id={league_id}", token=token)
 
 
 def main():
-    random.seed(SEED)
-
-    # --- Create 4 users ---
-    users = []
-    for i in range(1, 5):
-        username = f"{USER_PREFIX}{i}"
-        password = "password123"
-        token = register_or_login(username, password)
-        users.append({"username": username, "token": token})
+    # --- Create 4 users (independent, so in parallel over the shared session) ---
+    usernames = [f"{USER_PREFIX}{i}" for i in range(1, 5)]
+    with ThreadPoolExecutor(max_workers=len(usernames)) as ex:
+        tokens = list(ex.map(lambda username: register_or_login(username, "password123"), usernames))
+    users = [{"username": username, "token": token} for username, token in zip(usernames, tokens)]
 
     commissioner = users[0]
     print(f"✅ Logged in users: {[u['username'] for u in users]}")
@@ -121,8 +155,8 @@ def main():
     print(f"✅ League created: id={league_id} code={code}")
 
     # --- Join league (users 2-4) ---
-    for u in users[1:]:
-        join_league(u["token"], code)
+    with ThreadPoolExecutor(max_workers=len(users) - 1) as ex:
+        list(ex.map(lambda u: join_league(u["token"], code), users[1:]))
     print("✅ All users joined league")
 
     # --- Start draft ---
@@ -144,13 +178,16 @@ def main():
 
     # --- Draft loop (event-by-event, snake handled by backend) ---
     # We'll generate unique entry_key per pick, and rely on backend to enforce turn order.
-    used_keys_by_event = {}
+    picks_by_event = {}
+
+    # One state fetch up front; every pick response carries the next state.
+    state = draft_state(commissioner["token"], league_id)
+
+    for ev_index, target_event in enumerate(events_to_draft):
+        target_event_id = target_event["id"]
 
-    for ev_index in range(len(events_to_draft)):
         # Keep picking until backend advances to next event or draft complete
         while True:
-            state = draft_state(commissioner["token"], league_id)
-
             if state.get("complete"):
                 print("✅ Draft complete early")
                 break
@@ -159,28 +196,23 @@ def main():
             current_event_id = current_event["id"]
 
             # If we've moved past the event we intended, break to next
-            target_event_id = events_to_draft[ev_index]["id"]
             if current_event_id != target_event_id:
                 break
 
             otc = state["on_the_clock"]["username"]
             otc_token = token_by_username[otc]
 
-            used = used_keys_by_event.setdefault(current_event_id, set())
-            # create unique entry key
+            # unique entry key from a per-event pick counter
             # (you can change the format later to match real athlete/country IDs)
-            while True:
-                entry_key = f"EV{ev_index+1}-P{len(used)+1}-X{random.randint(1000,9999)}"
-                if entry_key not in used:
-                    used.add(entry_key)
-                    break
+            pick_num = picks_by_event[current_event_id] = picks_by_event.get(current_event_id, 0) + 1
+            entry_key = f"EV{ev_index+1}-P{pick_num}"
 
             entry_name = f"Test Entry {entry_key}"
 
-            make_pick(otc_token, league_id, entry_key, entry_name)
-            print(f"✅ Pick made: event={current_event['sort_order']} on_clock={otc} -> {entry_name}")
+            state = make_pick(otc_token, league_id, entry_key, entry_name)["state"]
+            log.debug("✅ Pick made: event=%s on_clock=%s -> %s", current_event["sort_order"], otc, entry_name)
 
-        print(f"✅ Finished drafting event index {ev_index} ({events_to_draft[ev_index]['name']})")
+        print(f"✅ Finished drafting event index {ev_index} ({target_event['name']})")
 
     # --- Lock league (so results submission is allowed) ---
     lock_league(commissioner["token"], league_id)
@@ -196,32 +228,27 @@ def main():
         "GET",
         f"/events/league/{league_id}/{first_event_id}/summary",
         token=commissioner["token"],
-    ).json()
+    )
 
     picks = summary.get("picks", [])
-    placements = []
     # Put drafted entries at top positions first
-    place = 1
-    for p in picks[:8]:
-        placements.append(
-            {"place": place, "entry_key": p["entry_key"], "entry_name": p["entry_name"]}
-        )
-        place += 1
+    placements = [
+        {"place": place, "entry_key": p["entry_key"], "entry_name": p["entry_name"]}
+        for place, p in enumerate(picks[:8], start=1)
+    ]
 
     # Fill remaining places with dummy entries if needed
-    while place <= 8:
-        ek = f"RESULT-DUMMY-{place}-{random.randint(1000,9999)}"
-        placements.append({"place": place, "entry_key": ek, "entry_name": f"Dummy {ek}"})
-        place += 1
+    placements.extend(
+        {"place": place, "entry_key": f"RESULT-DUMMY-{place}", "entry_name": f"Dummy RESULT-DUMMY-{place}"}
+        for place in range(len(placements) + 1, 9)
+    )
 
     submit_results(commissioner["token"], league_id, first_event_id, placements)
     print("✅ Results submitted for first event")
 
     # --- Leaderboard ---
     lb = leaderboard(commissioner["token"], league_id)
-    print("\n🏅 Leaderboard")
-    for row in lb["rows"]:
-        print(f"  {row['username']}: {row['points']}")
+    print("\n🏅 Leaderboard\n" + "\n".join(f"  {row['username']}: {row['points']}" for row in lb["rows"]))
 
     print("\n✅ Smoke test complete!")
 